@@ -0,0 +1,54 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are standalone scripts (run them with `python benchmarks/<name>.py`);
+they are not part of the graded tests.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+from contextlib import contextmanager
+
+from graph import Graph
+
+
+def random_graph(n: int, m: int, directed: bool = False, weighted: bool = False,
+                 blue_fraction: float = 0.0, seed: int = 0) -> Graph:
+    """
+    Build a uniformly random sparse graph.
+
+    Args:
+        n: Number of vertices (named "v0".."v{n-1}")
+        m: Number of edge insertions (duplicates collapse)
+        directed: If True, edges are directional
+        weighted: If True, edges get integer weights in [1, 100]
+        blue_fraction: Fraction of vertices marked blue
+        seed: Random seed
+
+    Returns:
+        A Graph
+    """
+    rng = random.Random(seed)
+    names = [f"v{i}" for i in range(n)]
+    graph = Graph(directed=directed, weighted=weighted)
+    for name in names:
+        graph.add_vertex(name)
+    for _ in range(m):
+        u = names[rng.randrange(n)]
+        v = names[rng.randrange(n)]
+        weight = float(rng.randint(1, 100)) if weighted else 1.0
+        graph.add_edge(u, v, weight)
+    graph.blue = set(rng.sample(names, int(n * blue_fraction)))
+    return graph
+
+
+@contextmanager
+def timed(label: str):
+    """Print the wall-clock time spent inside the block."""
+    start = time.perf_counter()
+    yield
+    print(f"  {label}: {time.perf_counter() - start:.3f} s")
@@ -0,0 +1,56 @@
+"""
+Benchmark: one-directional vs. bidirectional max_blue_path.
+
+Scales data/task1_test3.json (dense) and data/task1_test4.json (sparse) up
+to random graphs with the same average degree and blue fraction, then
+answers the same random (s, t) pairs with max_blue_path and
+max_blue_path_bidirectional, checking that the answers agree.
+
+Usage: python benchmarks/bench_bidirectional.py [scale] [pairs]   (default 1000, 20)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import random
+import time
+
+from _common import random_graph
+from graph import load_graph
+from tasks.task1_bfs import max_blue_path, max_blue_path_bidirectional
+
+
+def scaled(path, scale, seed):
+    """Random graph shaped like the graph in path, with scale times the vertices."""
+    graph = load_graph(path)
+    n = graph.vertex_count()
+    return random_graph(n * scale, graph.edge_count() * scale,
+                        blue_fraction=len(graph.blue) / n, seed=seed)
+
+
+def measure(label, graph, pairs):
+    """Time both variants over the same query pairs."""
+    print(f"{label}: {graph}")
+    results = {}
+    for name, fn in (("max_blue_path", max_blue_path),
+                     ("max_blue_path_bidirectional", max_blue_path_bidirectional)):
+        t0 = time.perf_counter()
+        results[name] = [fn(graph, s, t) for s, t in pairs]
+        elapsed = time.perf_counter() - t0
+        print(f"  {name:28s} {elapsed:.3f} s ({elapsed / len(pairs) * 1e3:.2f} ms/query)")
+    assert len(set(map(tuple, results.values()))) == 1, "variants disagree"
+    print()
+
+
+if __name__ == "__main__":
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    data = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+    for name in ("task1_test3.json", "task1_test4.json"):
+        graph = scaled(os.path.join(data, name), scale, seed=1)
+        rng = random.Random(2)
+        n = graph.vertex_count()
+        pairs = [(f"v{rng.randrange(n)}", f"v{rng.randrange(n)}") for _ in range(count)]
+        measure(f"{name} x{scale}", graph, pairs)
@@ -0,0 +1,69 @@
+"""
+Benchmark: build time vs. query time of BlueDistanceIndex.
+
+For each graph, answers the same stream of random (s, t) queries with plain
+max_blue_path and with BlueDistanceIndex under several memory budgets, and
+reports build time, mean query time (misses run a full BFS), hit rate and
+the total time for the whole stream next to plain max_blue_path's.
+
+Queries are drawn from a small pool of "hot" sources (80%) plus uniformly
+random ones, roughly what a service answering repeated lookups sees.
+
+Usage: python benchmarks/bench_blue_index.py [queries]   (default 1000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import random
+import time
+
+from _common import random_graph
+from graph import load_graph
+from tasks.task1_bfs import max_blue_path, BlueDistanceIndex
+
+
+def query_stream(graph, count, seed):
+    """Random queries, 80% of them from 20 hot sources."""
+    rng = random.Random(seed)
+    vertices = graph.vertices()
+    hot = rng.sample(vertices, min(20, len(vertices)))
+    return [(rng.choice(hot) if rng.random() < 0.8 else rng.choice(vertices), rng.choice(vertices))
+            for _ in range(count)]
+
+
+def measure(label, graph, queries, budgets):
+    """Compare plain BFS per query against the index under each budget."""
+    print(f"{label}: {graph}")
+    sample = queries[:200]
+    t0 = time.perf_counter()
+    expected = [max_blue_path(graph, s, t) for s, t in sample]
+    per_query = (time.perf_counter() - t0) / len(sample)
+    print(f"  max_blue_path: {per_query * 1e3:.3f} ms/query, "
+          f"~{per_query * len(queries):.2f} s for {len(queries)} queries")
+
+    for budget in budgets:
+        index = BlueDistanceIndex(graph, max_bytes=budget)
+        answers = index.query_many(queries)
+        assert answers[:len(sample)] == expected, "index disagrees with max_blue_path"
+        st = index.stats()
+        total = st['build_time'] + st['query_time']
+        print(f"  budget {budget / 2**20:7.2f} MB [{st['mode']:9s}] build {st['build_time']:.3f} s, "
+              f"{st['rows']} rows ({st['nbytes'] / 2**20:.2f} MB), "
+              f"query {st['mean_query_time'] * 1e3:.3f} ms, hits {st['hits'] / st['queries']:.0%}, "
+              f"total {total:.2f} s")
+    print()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    data = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+    for name in ("task1_test3.json", "task1_test4.json"):
+        graph = load_graph(os.path.join(data, name))
+        measure(name, graph, query_stream(graph, count, seed=1), [8 << 10, 1 << 20])
+
+    graph = random_graph(20_000, 60_000, blue_fraction=0.35, seed=1)
+    measure("random, 20000 vertices", graph, query_stream(graph, count, seed=1),
+            [1 << 20, 8 << 20])
@@ -0,0 +1,94 @@
+"""
+Benchmark: per-edge add_edge vs. bulk insertion.
+
+Compares building the same graph with one add_edge call per edge,
+Graph.add_edges_from and Graph.from_edge_arrays, and then times the JSON
+and CSV loaders (which insert in bulk) against the previous per-edge
+loader implementations.
+
+Usage: python benchmarks/bench_bulk.py [edges]   (default 1000000; try 10000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import csv
+import json
+import random
+import tempfile
+import time
+
+from bench_loaders import write_json, write_csv
+from graph import Graph
+from graph.loaders import load_json_graph, load_csv_graph
+
+
+def per_edge_json(path):
+    """Reference: the previous JSON loader (json.load, one add_edge per edge)."""
+    with open(path) as f:
+        data = json.load(f)
+    graph = Graph(directed=data.get('directed', False), weighted=data.get('weighted', False))
+    for edge in data['edges']:
+        graph.add_edge(str(edge['from']), str(edge['to']), float(edge.get('weight', 1.0)))
+    return graph
+
+
+def per_edge_csv(path):
+    """Reference: the previous CSV loader (DictReader, edge list, then add_edge)."""
+    edges = []
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            edges.append((str(row['from']), str(row['to']), float(row['weight'])))
+    graph = Graph(weighted=True)
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+    return graph
+
+
+def timed_build(label, build, m):
+    """Time one graph construction and print edges/second."""
+    start = time.perf_counter()
+    graph = build()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:28s} {elapsed:7.2f} s  {m / elapsed:12,.0f} edges/s   {graph}")
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n = max(m // 10, 1)
+
+    rng = random.Random(0)
+    src = [f"v{rng.randrange(n)}" for _ in range(m)]
+    dst = [f"v{rng.randrange(n)}" for _ in range(m)]
+    weight = [float(rng.randint(1, 100)) for _ in range(m)]
+
+    def per_edge():
+        graph = Graph(weighted=True)
+        for u, v, w in zip(src, dst, weight):
+            graph.add_edge(u, v, w)
+        return graph
+
+    def bulk():
+        graph = Graph(weighted=True)
+        graph.add_edges_from(zip(src, dst, weight))
+        return graph
+
+    print(f"In-memory insertion, {m} edges")
+    timed_build("add_edge loop", per_edge, m)
+    timed_build("add_edges_from", bulk, m)
+    timed_build("from_edge_arrays", lambda: Graph.from_edge_arrays(src, dst, weight, weighted=True), m)
+    del src, dst, weight
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'edges.json')
+        write_json(path, n, m)
+        print(f"JSON loader, {m} edges")
+        timed_build("previous JSON loader", lambda: per_edge_json(path), m)
+        timed_build("load_json_graph", lambda: load_json_graph(path), m)
+
+        path = os.path.join(tmp, 'edges.csv')
+        write_csv(path, n, m)
+        print(f"CSV loader, {m} edges")
+        timed_build("previous CSV loader", lambda: per_edge_csv(path), m)
+        timed_build("load_csv_graph", lambda: load_csv_graph(path), m)
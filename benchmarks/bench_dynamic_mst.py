@@ -0,0 +1,94 @@
+"""
+Benchmark: DynamicMST updates vs. recomputing MST() and second_best_ST().
+
+A random connected weighted graph receives a stream of random updates:
+new edges and new weights for existing edges. DynamicMST applies each
+one, and second_best_ST() is asked after every few updates; the baseline
+rebuilds both from scratch, timed on a few updates only and reported per
+update. Updates are timed by whether they changed the tree (heavier tree
+edges take the O(V + E) fallback), queries by whether the cached answer
+was still valid. At the end, the tree and second-best weights must match
+MST() and second_best_ST() on the updated graph.
+
+Usage: python benchmarks/bench_dynamic_mst.py [vertices] [edges] [updates] [updates per query]
+       (default 100000 1000000 1000 10)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import math
+import random
+import time
+from collections import defaultdict
+
+from bench_mst import connected_edges
+from graph import Graph
+from tasks.task2_mst import DynamicMST, MST, second_best_ST
+
+
+def total(edges):
+    return math.fsum(w for _, _, w in edges) if edges is not None else None
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    every = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+
+    graph = Graph(weighted=True)
+    graph.add_edges_from(connected_edges(n, m))
+    print(graph)
+
+    start = time.perf_counter()
+    dynamic = DynamicMST(graph)
+    print(f"  {'DynamicMST()':34s} {time.perf_counter() - start:7.2f} s")
+
+    rng = random.Random(1)
+    existing = [(u, v) for u, v, _ in graph.edges() if u != v]
+    updates = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            u, v = rng.choice(existing)
+        else:
+            u, v = f"v{rng.randrange(n)}", f"v{rng.randrange(n)}"
+        updates.append((u, v, float(rng.randint(1, 1000))))
+
+    # Full recompute, timed on a few updates
+    sample = min(2, count)
+    start = time.perf_counter()
+    for u, v, w in updates[:sample]:
+        graph.add_edge(u, v, w)
+        MST(graph)
+        second_best_ST(graph)
+    recompute = (time.perf_counter() - start) / sample
+    for u, v, w in updates[sample:]:
+        graph.add_edge(u, v, w)
+
+    seconds = defaultdict(float)
+    calls = defaultdict(int)
+    for i, (u, v, w) in enumerate(updates, 1):
+        start = time.perf_counter()
+        changed = dynamic.update_edge(u, v, w)
+        kind = "update, tree changed" if changed else "update, tree unchanged"
+        seconds[kind] += time.perf_counter() - start
+        calls[kind] += 1
+        if i % every == 0:
+            kind = "second_best_ST(), cached" if dynamic._second is not None else "second_best_ST(), rebuilt"
+            start = time.perf_counter()
+            dynamic.second_best_ST()
+            seconds[kind] += time.perf_counter() - start
+            calls[kind] += 1
+    dynamic_total = sum(seconds.values())
+
+    print(f"  {'recompute':34s} {recompute * 1000:9.2f} ms / update")
+    for kind in sorted(calls, reverse=True):
+        print(f"  {kind:34s} {seconds[kind] / calls[kind] * 1000:9.2f} ms / call     ({calls[kind]} calls)")
+    print(f"  {'DynamicMST, all':34s} {dynamic_total / count * 1000:9.2f} ms / update   "
+          f"({recompute * count / dynamic_total:.0f}x)")
+
+    expected = (total(MST(graph)), total(second_best_ST(graph)))
+    got = (dynamic.total_weight(), total(dynamic.second_best_ST()))
+    print(f"  {'ok' if got == expected else 'MISMATCH'}")
@@ -0,0 +1,87 @@
+"""
+Benchmark: queue BFS vs. level-synchronous frontier BFS.
+
+Compares, on a Graph and on its CSRGraph form:
+- examples/bfs_example.py's deque + set traversal against graph.bfs_levels
+- a max-blue BFS that compares and updates every same-level arc (the
+  previous Task 1 engine) against graph.bfs_max_marked, which sorts each
+  frontier by best count instead
+
+Usage: python benchmarks/bench_frontier.py [vertices] [edges]   (default 200000 1000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples'))
+
+import time
+
+from _common import random_graph
+from graph import CSRGraph, bfs_levels, bfs_max_marked
+from bfs_example import bfs_traversal
+
+
+def max_marked_update(graph, source, marked):
+    """Max-blue BFS that re-checks every arc into the current level."""
+    n = graph.vertex_count()
+    dist = [-1] * n
+    best = [0] * n
+    dist[source] = 0
+    best[source] = marked[source]
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            bu = best[u]
+            for v in graph.neighbor_ids(u):
+                dv = dist[v]
+                if dv < 0:
+                    dist[v] = depth
+                    best[v] = bu + marked[v]
+                    next_frontier.append(v)
+                elif dv == depth and bu + marked[v] > best[v]:
+                    best[v] = bu + marked[v]
+        frontier = next_frontier
+    return dist, best
+
+
+def best_of(fn, repeat=5):
+    """Minimum wall time of several runs (the machine may be noisy)."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def measure(label, graph, marked):
+    """Time every variant on one graph."""
+    print(f"{label}: {graph}")
+    assert max_marked_update(graph, 0, marked) == bfs_max_marked(graph, 0, marked), "engines disagree"
+    start = graph.vertex_name(0)
+    runs = [
+        ("deque + set traversal", lambda: bfs_traversal(graph, start)),
+        ("bfs_levels", lambda: sum(1 for _ in bfs_levels(graph, 0))),
+        ("max-blue, per-arc update", lambda: max_marked_update(graph, 0, marked)),
+        ("bfs_max_marked", lambda: bfs_max_marked(graph, 0, marked)),
+    ]
+    for name, fn in runs:
+        print(f"  {name:26s} {best_of(fn):.3f} s")
+    print()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    graph = random_graph(n, m, blue_fraction=0.4, seed=1)
+    marked = bytearray(n)
+    for name in graph.blue:
+        marked[graph.vertex_id(name)] = 1
+
+    measure("Graph", graph, marked)
+    measure("CSRGraph", CSRGraph.from_graph(graph), marked)
@@ -0,0 +1,69 @@
+"""
+Benchmark: incremental betweenness updates vs. full recomputation.
+
+Builds IncrementalBetweenness on a random graph, inserts random new edges
+one at a time and reports the latency of each update, the share of sources
+it affected and of per-source vertex states it recomputed, next to the
+time of a full centralities() call.
+The final incremental values are checked against a full recomputation.
+
+Usage: python benchmarks/bench_incremental.py [vertices] [edges] [updates]
+       (default 1000 3000 50)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import random
+import time
+
+from _common import random_graph
+from tasks.task3_choice import centralities, IncrementalBetweenness
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    updates = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    for directed in (False, True):
+        graph = random_graph(n, m, directed=directed, seed=1)
+        print(f"{graph}, {updates} edge insertions")
+
+        t0 = time.perf_counter()
+        centralities(graph)
+        full = time.perf_counter() - t0
+        print(f"  full centralities()   {full * 1e3:9.1f} ms")
+
+        t0 = time.perf_counter()
+        engine = IncrementalBetweenness(graph)
+        print(f"  initial build         {(time.perf_counter() - t0) * 1e3:9.1f} ms")
+
+        rng = random.Random(2)
+        latencies = []
+        affected = []
+        touched = []
+        while len(latencies) < updates:
+            u, v = f"v{rng.randrange(n)}", f"v{rng.randrange(n)}"
+            if u == v or graph.has_edge(u, v):
+                continue
+            t0 = time.perf_counter()
+            engine.add_edge(u, v)
+            latencies.append(time.perf_counter() - t0)
+            affected.append(engine.last_affected)
+            touched.append(engine.last_touched)
+
+        latencies.sort()
+        mean = sum(latencies) / len(latencies)
+        print(f"  update mean           {mean * 1e3:9.1f} ms ({full / mean:.1f}x faster than full)")
+        print(f"  update median / max   {latencies[len(latencies) // 2] * 1e3:9.1f} / "
+              f"{latencies[-1] * 1e3:.1f} ms")
+        print(f"  sources affected      {sum(affected) / len(affected) / n:9.1%} on average")
+        print(f"  vertex states redone  {sum(touched) / len(touched) / (n * n):9.1%} of all source/vertex pairs")
+
+        expected = centralities(graph)
+        result = engine.centralities()
+        error = max(abs(result[v] - expected[v]) for v in expected)
+        print(f"  max deviation from full recomputation: {error:.2e}")
+        print()
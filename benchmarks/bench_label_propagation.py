@@ -0,0 +1,55 @@
+"""
+Benchmark: label propagation, serial and on process pools, vs. Louvain.
+
+Runs label_propagation() on a planted-partition graph (see bench_louvain.py)
+serially and with 2 and 4 worker processes, then louvain(), and prints the
+time, rounds, communities and modularity of each. All label propagation
+runs must produce the same partition.
+
+Usage: python benchmarks/bench_label_propagation.py [vertices] [edges] [group_size] [inside]
+       (default 100000 1000000 100 0.8)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import time
+
+from bench_louvain import planted_partition
+from graph.quality import partition_quality
+from tasks.task3_choice import label_propagation, louvain
+
+
+def report(label, seconds, membership, rounds=None):
+    quality = partition_quality(graph, membership)
+    extra = f", {rounds} rounds" if rounds is not None else ""
+    print(f"  {label:32s} {seconds:7.2f} s{extra}, {quality['communities']} communities, "
+          f"modularity {quality['modularity']:.4f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    group_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    inside = float(sys.argv[4]) if len(sys.argv) > 4 else 0.8
+
+    graph = planted_partition(n, m, group_size, inside)
+    print(f"{graph}, planted groups of {group_size}, {inside:.0%} of edges inside "
+          f"({os.cpu_count()} cores)")
+
+    reference = None
+    for processes in (None, 2, 4):
+        t0 = time.perf_counter()
+        membership, changes = label_propagation(graph, processes=processes)
+        seconds = time.perf_counter() - t0
+        name = "serial" if processes is None else f"{processes} processes"
+        report(f"label propagation, {name}", seconds, membership, len(changes))
+        if reference is None:
+            reference = membership
+        elif membership != reference:
+            print("  MISMATCH with the serial partition")
+
+    t0 = time.perf_counter()
+    membership, _ = louvain(graph)
+    report("louvain", time.perf_counter() - t0, membership)
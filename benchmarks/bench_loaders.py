@@ -0,0 +1,77 @@
+"""
+Benchmark: graph loaders on a synthetic edge list.
+
+Writes a task1_test3.json-style file and an equivalent weighted CSV file
+with the requested number of edges to a temporary directory, then loads
+them with each loader variant, reporting
+throughput (edges/second) and tracemalloc peak memory.
+
+Usage: python benchmarks/bench_loaders.py [edges]   (default 1000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+
+import _common  # noqa: F401  (puts the repository root on sys.path)
+from graph.loaders import load_json_graph, stream_json_graph, load_csv_graph
+
+
+def write_json(path, n, m, seed=0):
+    """Write an undirected, unweighted graph with m random edges over n vertices."""
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        f.write('{\n  "directed": false,\n  "weighted": false,\n')
+        f.write(f'  "blue": {json.dumps([f"v{i}" for i in range(0, n, 10)])},\n')
+        f.write('  "edges": [\n')
+        for k in range(m):
+            sep = ',\n' if k < m - 1 else '\n'
+            f.write(f'    {{"from": "v{rng.randrange(n)}", "to": "v{rng.randrange(n)}"}}{sep}')
+        f.write('  ]\n}\n')
+
+
+def write_csv(path, n, m, seed=0):
+    """Write a weighted graph with m random edges over n vertices as CSV."""
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        f.write('from,to,weight\n')
+        for _ in range(m):
+            f.write(f'v{rng.randrange(n)},v{rng.randrange(n)},{rng.randint(1, 100)}\n')
+
+
+def run(label, load, m):
+    """Load once for timing and once under tracemalloc for peak memory."""
+    start = time.perf_counter()
+    graph = load()
+    elapsed = time.perf_counter() - start
+    del graph
+    tracemalloc.start()
+    graph = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:32s} {m / elapsed:12,.0f} edges/s   peak {peak / 1e6:8.1f} MB   {graph}")
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n = max(m // 10, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'edges.json')
+        write_json(path, n, m)
+        print(f"JSON, {m} edges ({os.path.getsize(path) / 1e6:.1f} MB on disk)")
+        run("load_json_graph", lambda: load_json_graph(path), m)
+        run("load_json_graph(csr=True)", lambda: load_json_graph(path, csr=True), m)
+        run("stream_json_graph", lambda: stream_json_graph(path), m)
+        run("stream_json_graph(csr=True)", lambda: stream_json_graph(path, csr=True), m)
+        
+        path = os.path.join(tmp, 'edges.csv')
+        write_csv(path, n, m)
+        print(f"CSV, {m} edges ({os.path.getsize(path) / 1e6:.1f} MB on disk)")
+        run("load_csv_graph", lambda: load_csv_graph(path), m)
+        run("load_csv_graph(csr=True)", lambda: load_csv_graph(path, csr=True), m)
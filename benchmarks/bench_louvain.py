@@ -0,0 +1,62 @@
+"""
+Benchmark: Louvain community detection on large planted-partition graphs.
+
+Generates a graph whose vertices fall into equal-size planted groups, with
+a given share of the edges inside groups, runs louvain() and prints the
+communities, modularity and time of every level, plus the total.
+
+Usage: python benchmarks/bench_louvain.py [vertices] [edges] [group_size] [inside]
+       (default 100000 1000000 100 0.8)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import random
+import time
+
+import _common  # noqa: F401  (puts the repository root on sys.path)
+from graph import Graph
+from tasks.task3_choice import louvain
+
+
+def planted_partition(n, m, group_size, inside, seed=0):
+    """Random graph with m edge insertions, a share inside of them within groups."""
+    rng = random.Random(seed)
+    names = [f"v{i}" for i in range(n)]
+    graph = Graph()
+    for name in names:
+        graph.add_vertex(name)
+
+    def edges():
+        for _ in range(m):
+            u = rng.randrange(n)
+            if rng.random() < inside:
+                base = u - u % group_size
+                v = base + rng.randrange(min(group_size, n - base))
+            else:
+                v = rng.randrange(n)
+            if u != v:
+                yield names[u], names[v]
+
+    graph.add_edges_from(edges())
+    return graph
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    group_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    inside = float(sys.argv[4]) if len(sys.argv) > 4 else 0.8
+
+    graph = planted_partition(n, m, group_size, inside)
+    print(f"{graph}, planted groups of {group_size}, {inside:.0%} of edges inside")
+
+    t0 = time.perf_counter()
+    membership, levels = louvain(graph)
+    total = time.perf_counter() - t0
+    for depth, level in enumerate(levels, 1):
+        print(f"  level {depth}: {level['communities']:7d} communities, "
+              f"modularity {level['modularity']:.4f}, {level['seconds']:.2f} s")
+    print(f"  total: {total:.2f} s ({len(set(membership))} communities)")
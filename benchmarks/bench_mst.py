@@ -0,0 +1,79 @@
+"""
+Benchmark: Kruskal over edges() tuples vs. MST() on edge arrays vs. Borůvka.
+
+The baseline is the textbook version: sort graph.edges() by weight and
+unite names with the dict-based UnionFind. MST() sorts a permutation of
+graph.edge_arrays() and streams it into ArrayUnionFind.union_many (which
+stops once the tree spans the graph). MST_boruvka() runs serially and on
+2 and 4 worker processes and must return exactly the same tree as MST().
+Everything runs on a random connected weighted graph (MST() also on a
+CSRGraph copy and on that copy reopened from a snapshot, whose weights
+are memoryviews); the tree weights must agree with the baseline.
+
+Usage: python benchmarks/bench_mst.py [vertices] [edges]   (default 100000 1000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import io
+import random
+
+from _common import timed
+from examples.union_find_example import UnionFind
+from graph import CSRBuilder, Graph
+from graph.snapshot import open_snapshot, write_snapshot
+from tasks.task2_mst import MST, MST_boruvka
+
+
+def naive_mst(graph):
+    """Reference: Kruskal over sorted edges() with the dict UnionFind."""
+    uf = UnionFind(graph.vertices())
+    return [(u, v, w) for u, v, w in sorted(graph.edges(), key=lambda e: e[2]) if uf.union(u, v)]
+
+
+def connected_edges(n, m, seed=0):
+    """A random spanning path plus random edges, with random integer weights."""
+    rng = random.Random(seed)
+    perm = list(range(n))
+    rng.shuffle(perm)
+    edges = [(f"v{perm[i]}", f"v{perm[i + 1]}") for i in range(n - 1)]
+    edges += [(f"v{rng.randrange(n)}", f"v{rng.randrange(n)}") for _ in range(m - (n - 1))]
+    return [(u, v, float(rng.randint(1, 1000))) for u, v in edges]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    edges = connected_edges(n, m)
+    graph = Graph(weighted=True)
+    graph.add_edges_from(edges)
+    builder = CSRBuilder(weighted=True)
+    builder.add_edges_from(edges)
+    csr = builder.build()
+    data = io.BytesIO()
+    write_snapshot(csr, data)
+    snapshot = open_snapshot(data.getbuffer())
+    del edges, builder
+    print(graph)
+
+    with timed("naive Kruskal (edges() + dict UnionFind)"):
+        naive = naive_mst(graph)
+    weight = sum(w for _, _, w in naive)
+    trees = {}
+    for label, g in (("Graph", graph), ("CSRGraph", csr), ("snapshot", snapshot)):
+        with timed(f"MST() on {label}"):
+            tree = trees[label] = MST(g)
+        status = "ok" if len(tree) == len(naive) and sum(w for _, _, w in tree) == weight else "MISMATCH"
+        print(f"  {len(tree)} edges, weight {weight:.0f}: {status}")
+
+    for processes in (None, 2, 4):
+        label = "serial" if processes is None else f"{processes} processes"
+        with timed(f"MST_boruvka() on Graph, {label}"):
+            same = MST_boruvka(graph, processes) == trees["Graph"]
+        print(f"  same tree as MST(): {'ok' if same else 'MISMATCH'}")
+    with timed("MST_boruvka() on snapshot, 2 processes"):
+        same = MST_boruvka(snapshot, 2) == trees["snapshot"]
+    print(f"  same tree as MST(): {'ok' if same else 'MISMATCH'}")
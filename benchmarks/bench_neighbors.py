@@ -0,0 +1,79 @@
+"""
+Benchmark: list-returning vs. iterator/view neighbor access.
+
+Runs the same BFS over Graph.neighbors() (one list per visited vertex) and
+Graph.iter_neighbors() (no per-step list), reporting wall time, the bytes of
+temporary neighbor lists the list-based loop creates, and the tracemalloc
+peak of each traversal.
+
+Usage: python benchmarks/bench_neighbors.py [edges]   (default 1000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import time
+import tracemalloc
+from collections import deque
+
+from _common import random_graph
+from graph import load_graph
+
+
+def bfs_lists(graph, start):
+    """BFS that asks for a fresh neighbor list per vertex."""
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        vertex = queue.popleft()
+        for neighbor in graph.neighbors(vertex):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return len(visited)
+
+
+def bfs_iter(graph, start):
+    """BFS that iterates the adjacency in place."""
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        vertex = queue.popleft()
+        for neighbor in graph.iter_neighbors(vertex):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return len(visited)
+
+
+def list_bytes(graph):
+    """Total size of the temporary lists neighbors() builds in one full pass."""
+    return sum(sys.getsizeof(graph.neighbors(v)) for v in graph.iter_vertices())
+
+
+def measure(label, graph, start):
+    """Run both traversals and print time and memory figures."""
+    print(f"{label}: {graph}")
+    print(f"  neighbor lists built per traversal: {list_bytes(graph) / 1e6:.2f} MB")
+    for name, bfs in (("neighbors()", bfs_lists), ("iter_neighbors()", bfs_iter)):
+        t0 = time.perf_counter()
+        bfs(graph, start)
+        elapsed = time.perf_counter() - t0
+        tracemalloc.start()
+        bfs(graph, start)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {name:18s} {elapsed:.3f} s, traced peak {peak / 1e6:.2f} MB")
+    print()
+
+
+if __name__ == "__main__":
+    edges = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = os.path.join(os.path.dirname(__file__), '..', 'data', 'task1_test3.json')
+
+    graph = load_graph(data)
+    measure("task1_test3.json", graph, graph.vertices()[0])
+
+    graph = random_graph(edges // 10, edges, seed=1)
+    measure(f"random, {edges} edges", graph, "v0")
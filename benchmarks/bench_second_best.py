@@ -0,0 +1,81 @@
+"""
+Benchmark: second_best_ST() with path-maximum queries vs. cycle walking.
+
+The baseline is the hinted O(VE) method: for every non-tree edge, walk the
+tree path between its endpoints to find the heaviest edge (and the
+heaviest strictly lighter one, for ties). second_best_ST() answers each
+non-tree edge with a binary-lifting query instead. Both must find the
+same weight. The baseline only runs on the smaller graph.
+
+Usage: python benchmarks/bench_second_best.py [vertices] [edges]   (default 100000 1000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import math
+import time
+
+from bench_mst import connected_edges
+from graph import Graph
+from tasks.task2_mst import MST, second_best_ST
+
+
+def naive_second_best_weight(graph):
+    """Reference: weight of the second-best tree by walking each cycle."""
+    tree = MST(graph)
+    total = sum(w for _, _, w in tree)
+    adjacency = {v: [] for v in graph.vertices()}
+    for u, v, w in tree:
+        adjacency[u].append((v, w))
+        adjacency[v].append((u, w))
+    # Parent pointers and depths from one root (the test graphs are connected)
+    root = graph.vertices()[0]
+    parent = {root: (None, -math.inf)}
+    depth = {root: 0}
+    stack = [root]
+    while stack:
+        u = stack.pop()
+        for v, w in adjacency[u]:
+            if v not in parent:
+                parent[v] = (u, w)
+                depth[v] = depth[u] + 1
+                stack.append(v)
+    in_tree = {(u, v) for u, v, _ in tree} | {(v, u) for u, v, _ in tree}
+    best = math.inf
+    for u, v, w in graph.edges():
+        if u == v or (u, v) in in_tree:
+            continue
+        weights = []
+        while u != v:
+            if depth[u] < depth[v]:
+                u, v = v, u
+            u, up = parent[u]
+            weights.append(up)
+        first = max(weights)
+        drop = first if w > first else max((x for x in weights if x < first), default=-math.inf)
+        if drop != -math.inf:
+            best = min(best, w - drop)
+    return total + best
+
+
+def timed_weight(label, run):
+    start = time.perf_counter()
+    weight = run()
+    print(f"  {label:34s} {time.perf_counter() - start:7.2f} s   weight {weight:.0f}")
+    return weight
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    for size, edges in ((n // 10, m // 10), (n, m)):
+        graph = Graph(weighted=True)
+        graph.add_edges_from(connected_edges(size, edges))
+        print(graph)
+        fast = timed_weight("second_best_ST()", lambda: sum(w for _, _, w in second_best_ST(graph)))
+        if size < n:
+            slow = timed_weight("cycle walking (O(VE))", lambda: naive_second_best_weight(graph))
+            print(f"  {'ok' if slow == fast else 'MISMATCH'}")
@@ -0,0 +1,70 @@
+"""
+Benchmark: dict-based UnionFind vs. array-backed ArrayUnionFind, and MST.
+
+Unites the endpoints of m random edges on n = m / 10 elements with the
+dict UnionFind (string keys), ArrayUnionFind.union per pair and
+ArrayUnionFind.union_many, printing time and approximate memory of each,
+then times tasks.task2_mst.MST (Kruskal on ArrayUnionFind) on a CSRGraph
+with the same edges.
+
+Usage: python benchmarks/bench_union_find.py [edges]   (default 1000000; try 10000000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import random
+import time
+import tracemalloc
+from array import array
+
+import _common  # noqa: F401  (puts the repository root on sys.path)
+from examples.union_find_example import UnionFind, ArrayUnionFind
+from graph import CSRBuilder
+from tasks.task2_mst import MST
+
+
+def measure(label, build, run):
+    """Time run(build()) and report the peak memory of build()."""
+    tracemalloc.start()
+    structure = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    merges = run(structure)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34s} {elapsed:7.2f} s   structure {peak / 2**20:8.1f} MiB   {merges} merges")
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n = max(m // 10, 1)
+    rng = random.Random(0)
+    src = array('i', (rng.randrange(n) for _ in range(m)))
+    dst = array('i', (rng.randrange(n) for _ in range(m)))
+    print(f"{m:,} random edges on {n:,} elements")
+
+    names = [f"v{i}" for i in range(n)]
+    src_names = [names[i] for i in src]
+    dst_names = [names[i] for i in dst]
+    measure("UnionFind (dicts, names)", lambda: UnionFind(names),
+            lambda uf: sum(map(uf.union, src_names, dst_names)))
+    del src_names, dst_names
+    measure("ArrayUnionFind.union", lambda: ArrayUnionFind(n),
+            lambda uf: sum(map(uf.union, src, dst)))
+    measure("ArrayUnionFind.union_many", lambda: ArrayUnionFind(n),
+            lambda uf: len(uf.union_many(src, dst)))
+
+    builder = CSRBuilder(weighted=True)
+    for name in names:
+        builder.add_vertex(name)
+    builder.add_edges_from(zip(map(names.__getitem__, src), map(names.__getitem__, dst),
+                               (rng.random() for _ in range(m))))
+    graph = builder.build()
+    del builder
+
+    start = time.perf_counter()
+    tree = MST(graph)
+    elapsed = time.perf_counter() - start
+    print(f"  MST on {graph}: {elapsed:.2f} s, {len(tree):,} tree edges")
@@ -11,7 +11,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from graph import Graph
+from graph import Graph, bfs_levels
 from collections import deque
 
 
@@ -27,7 +27,7 @@ def bfs_traversal(graph: Graph, start: str) -> list:
         A list of vertices in the order they were visited
     """
     # Check if start vertex exists
-    if start not in graph.vertices():
+    if start not in graph:
         raise KeyError(f"Start vertex {start} not found in graph")
     
     visited = set()
@@ -42,7 +42,7 @@ def bfs_traversal(graph: Graph, start: str) -> list:
         traversal_order.append(vertex)
         
         # Enqueue all unvisited neighbors
-        for neighbor in graph.neighbors(vertex):
+        for neighbor in graph.iter_neighbors(vertex):
             if neighbor not in visited:
                 visited.add(neighbor)
                 queue.append(neighbor)
@@ -63,7 +63,7 @@ def bfs_shortest_path(graph: Graph, start: str, goal: str) -> list:
         A list representing the path from start to goal.
         Returns empty list if no path exists.
     """
-    if start not in graph.vertices() or goal not in graph.vertices():
+    if start not in graph or goal not in graph:
         return []
     
     if start == goal:
@@ -76,7 +76,7 @@ def bfs_shortest_path(graph: Graph, start: str, goal: str) -> list:
     while queue:
         vertex, path = queue.popleft()
         
-        for neighbor in graph.neighbors(vertex):
+        for neighbor in graph.iter_neighbors(vertex):
             if neighbor == goal:
                 return path + [neighbor]
             
@@ -87,6 +87,29 @@ def bfs_shortest_path(graph: Graph, start: str, goal: str) -> list:
     return []
 
 
+def bfs_distances_by_level(graph: Graph, start: str) -> dict:
+    """
+    Compute hop distances from start using the level-synchronous BFS.
+    
+    graph.bfs_levels works on integer vertex ids and expands one whole
+    level at a time, which avoids the per-vertex queue operations and
+    name hashing above; only the result is translated back to names.
+    
+    Args:
+        graph: The graph to traverse
+        start: The starting vertex
+        
+    Returns:
+        A dict mapping each reachable vertex to its distance from start
+    """
+    distances = {}
+    for depth, level in enumerate(bfs_levels(graph, graph.vertex_id(start))):
+        for i in level:
+            distances[graph.vertex_name(i)] = depth
+    
+    return distances
+
+
 if __name__ == "__main__":
     # Example usage
     print("BFS Example")
@@ -113,3 +136,9 @@ if __name__ == "__main__":
     print("Shortest path from A to E:")
     path = bfs_shortest_path(g, "A", "E")
     print(" -> ".join(path))
+    print()
+    
+    # Distances by level
+    print("Distances from A (level-synchronous BFS):")
+    for vertex, depth in bfs_distances_by_level(g, "A").items():
+        print(f"  {vertex}: {depth}")
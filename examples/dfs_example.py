@@ -25,7 +25,7 @@ def dfs_traversal(graph: Graph, start: str) -> list:
     Returns:
         A list of vertices in the order they were visited
     """
-    if start not in graph.vertices():
+    if start not in graph:
         raise KeyError(f"Start vertex {start} not found in graph")
     
     visited = set()
@@ -36,7 +36,7 @@ def dfs_traversal(graph: Graph, start: str) -> list:
         visited.add(vertex)
         traversal_order.append(vertex)
         
-        for neighbor in graph.neighbors(vertex):
+        for neighbor in graph.iter_neighbors(vertex):
             if neighbor not in visited:
                 dfs_recursive(neighbor)
     
@@ -55,7 +55,7 @@ def dfs_iterative(graph: Graph, start: str) -> list:
     Returns:
         A list of vertices in the order they were visited
     """
-    if start not in graph.vertices():
+    if start not in graph:
         raise KeyError(f"Start vertex {start} not found in graph")
     
     visited = set()
@@ -91,7 +91,7 @@ def has_path_dfs(graph: Graph, start: str, goal: str) -> bool:
     Returns:
         True if a path exists, False otherwise
     """
-    if start not in graph.vertices() or goal not in graph.vertices():
+    if start not in graph or goal not in graph:
         return False
     
     if start == goal:
@@ -105,7 +105,7 @@ def has_path_dfs(graph: Graph, start: str, goal: str) -> bool:
         
         visited.add(vertex)
         
-        for neighbor in graph.neighbors(vertex):
+        for neighbor in graph.iter_neighbors(vertex):
             if neighbor not in visited:
                 if dfs_search(neighbor):
                     return True
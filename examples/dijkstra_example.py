@@ -31,16 +31,16 @@ def dijkstra(graph: Graph, source: str) -> dict:
         KeyError: If source does not exist
         ValueError: If graph has negative edge weights
     """
-    if source not in graph.vertices():
+    if source not in graph:
         raise KeyError(f"Source vertex {source} not found in graph")
     
     # Check for negative weights
-    for u, v, w in graph.edges():
+    for u, v, w in graph.iter_edges():
         if w < 0:
             raise ValueError("Dijkstra's algorithm does not work with negative edge weights")
     
     # Initialize distances
-    distances = {vertex: float('inf') for vertex in graph.vertices()}
+    distances = {vertex: float('inf') for vertex in graph.iter_vertices()}
     distances[source] = 0
     
     # Priority queue: (distance, vertex)
@@ -57,11 +57,10 @@ def dijkstra(graph: Graph, source: str) -> dict:
         visited.add(u)
         
         # Update distances to neighbors
-        for v in graph.neighbors(u):
+        for v, weight in graph.neighbor_items(u):
             if v in visited:
                 continue
             
-            weight = graph.weight(u, v)
             new_dist = current_dist + weight
             
             if new_dist < distances[v]:
@@ -86,16 +85,16 @@ def dijkstra_with_path(graph: Graph, source: str, target: str) -> tuple:
         - path is a list of vertices in the shortest path
         Returns (float('inf'), []) if no path exists.
     """
-    if source not in graph.vertices() or target not in graph.vertices():
+    if source not in graph or target not in graph:
         return (float('inf'), [])
     
     if source == target:
         return (0, [source])
     
     # Initialize
-    distances = {vertex: float('inf') for vertex in graph.vertices()}
+    distances = {vertex: float('inf') for vertex in graph.iter_vertices()}
     distances[source] = 0
-    previous = {vertex: None for vertex in graph.vertices()}
+    previous = {vertex: None for vertex in graph.iter_vertices()}
     
     pq = [(0, source)]
     visited = set()
@@ -111,11 +110,10 @@ def dijkstra_with_path(graph: Graph, source: str, target: str) -> tuple:
         
         visited.add(u)
         
-        for v in graph.neighbors(u):
+        for v, weight in graph.neighbor_items(u):
             if v in visited:
                 continue
             
-            weight = graph.weight(u, v)
             new_dist = current_dist + weight
             
             if new_dist < distances[v]:
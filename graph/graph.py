@@ -8,7 +8,9 @@ This module provides a simple Graph class supporting both directed/undirected
 and weighted/unweighted graphs.
 """
 
-from typing import List, Set, Dict, Tuple, Optional
+from array import array
+from itertools import repeat
+from typing import List, Set, Dict, Tuple, Optional, Iterable, Iterator, KeysView, ItemsView, Sequence
 
 
 class Graph:
@@ -17,6 +19,12 @@ class Graph:
     
     The graph is represented using an adjacency list structure.
     
+    Vertex names are interned: each name is mapped once to a dense integer
+    id (0, 1, 2, ... in insertion order) and the adjacency is stored by id.
+    The name-based methods translate at the boundary; algorithms that care
+    about speed can use the id-based methods (vertex_id, vertex_name,
+    neighbor_ids, neighbor_id_items) directly.
+    
     Attributes:
         directed (bool): Whether the graph is directed
         weighted (bool): Whether the graph has edge weights
@@ -32,18 +40,36 @@ class Graph:
         """
         self.directed = directed
         self.weighted = weighted
-        self._adjacency: Dict[str, Dict[str, float]] = {}
+        self._ids: Dict[str, int] = {}  # Vertex name -> id
+        self._names: List[str] = []  # Vertex id -> name
+        self._adjacency: List[Dict[int, float]] = []  # Vertex id -> {neighbor id: weight}
+        self._edge_count = 0  # Kept live by add_edge so edge_count() is O(1)
         self.blue: Set[str] = set()  # Set of blue vertices (for Task 1)
     
-    def add_vertex(self, vertex: str) -> None:
+    def _id(self, vertex: str) -> int:
+        """Look up the id of a vertex, raising KeyError if it is missing."""
+        i = self._ids.get(vertex)
+        if i is None:
+            raise KeyError(f"Vertex {vertex} not found in graph")
+        return i
+    
+    def add_vertex(self, vertex: str) -> int:
         """
         Add a vertex to the graph.
         
         Args:
             vertex: The vertex identifier
+        
+        Returns:
+            The integer id of the vertex (existing or newly assigned)
         """
-        if vertex not in self._adjacency:
-            self._adjacency[vertex] = {}
+        i = self._ids.get(vertex)
+        if i is None:
+            i = len(self._names)
+            self._ids[vertex] = i
+            self._names.append(vertex)
+            self._adjacency.append({})
+        return i
     
     def add_edge(self, u: str, v: str, weight: float = 1.0) -> None:
         """
@@ -55,15 +81,142 @@ class Graph:
             weight: Edge weight (default 1.0)
         """
         # Ensure both vertices exist
-        self.add_vertex(u)
-        self.add_vertex(v)
+        i = self.add_vertex(u)
+        j = self.add_vertex(v)
+        
+        # Count the edge only if it is new (re-adding just updates the weight)
+        row = self._adjacency[i]
+        if j not in row:
+            self._edge_count += 1
         
         # Add edge from u to v
-        self._adjacency[u][v] = weight
+        row[j] = weight
         
         # If undirected, also add edge from v to u
         if not self.directed:
-            self._adjacency[v][u] = weight
+            self._adjacency[j][i] = weight
+    
+    def add_edges_from(self, edges: Iterable[Sequence]) -> None:
+        """
+        Add many edges at once.
+        
+        Equivalent to calling add_edge for each item, but with the vertex
+        interning and counting inlined, so it is much cheaper per edge.
+        
+        Args:
+            edges: Iterable of (u, v) or (u, v, weight) tuples
+        """
+        ids = self._ids
+        names = self._names
+        adjacency = self._adjacency
+        directed = self.directed
+        count = self._edge_count
+        try:
+            for edge in edges:
+                if len(edge) == 3:
+                    u, v, weight = edge
+                else:
+                    u, v = edge
+                    weight = 1.0
+                i = ids.get(u)
+                if i is None:
+                    i = ids[u] = len(names)
+                    names.append(u)
+                    adjacency.append({})
+                j = ids.get(v)
+                if j is None:
+                    j = ids[v] = len(names)
+                    names.append(v)
+                    adjacency.append({})
+                row = adjacency[i]
+                if j not in row:
+                    count += 1
+                row[j] = weight
+                if not directed:
+                    adjacency[j][i] = weight
+        finally:
+            self._edge_count = count
+    
+    @classmethod
+    def from_edge_arrays(cls, src: Sequence[str], dst: Sequence[str],
+                         weight: Optional[Sequence[float]] = None,
+                         directed: bool = False, weighted: bool = False) -> 'Graph':
+        """
+        Build a graph from parallel arrays of edge endpoints and weights.
+        
+        Equivalent to adding the edges one by one with add_edge, using the
+        add_edges_from fast path.
+        
+        Args:
+            src: Source vertex of each edge
+            dst: Destination vertex of each edge
+            weight: Weight of each edge (default 1.0 for all)
+            directed: If True, edges are directional
+            weighted: If True, edges have weights
+            
+        Returns:
+            A new Graph
+            
+        Raises:
+            ValueError: If the arrays have different lengths
+        """
+        if len(src) != len(dst) or (weight is not None and len(weight) != len(src)):
+            raise ValueError("Edge arrays must have the same length")
+        
+        graph = cls(directed=directed, weighted=weighted)
+        graph.add_edges_from(zip(src, dst, repeat(1.0) if weight is None else weight))
+        return graph
+    
+    def vertex_id(self, vertex: str) -> int:
+        """
+        Get the integer id of a vertex.
+        
+        Args:
+            vertex: The vertex name
+        
+        Returns:
+            The dense id in range(vertex_count())
+        
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        return self._id(vertex)
+    
+    def vertex_name(self, i: int) -> str:
+        """
+        Get the name of the vertex with the given id.
+        
+        Args:
+            i: A vertex id
+        
+        Returns:
+            The vertex name
+        """
+        return self._names[i]
+    
+    def neighbor_ids(self, i: int) -> KeysView[int]:
+        """
+        Get the ids of all neighbors of the vertex with id i.
+        
+        Args:
+            i: A vertex id
+        
+        Returns:
+            A live view of neighbor ids
+        """
+        return self._adjacency[i].keys()
+    
+    def neighbor_id_items(self, i: int) -> ItemsView[int, float]:
+        """
+        Get (neighbor id, weight) pairs of the vertex with id i.
+        
+        Args:
+            i: A vertex id
+        
+        Returns:
+            A live view of (neighbor id, weight) pairs
+        """
+        return self._adjacency[i].items()
     
     def vertices(self) -> List[str]:
         """
@@ -72,7 +225,7 @@ class Graph:
         Returns:
             List of vertex identifiers
         """
-        return list(self._adjacency.keys())
+        return list(self._names)
     
     def neighbors(self, vertex: str) -> List[str]:
         """
@@ -87,9 +240,73 @@ class Graph:
         Raises:
             KeyError: If vertex does not exist in graph
         """
-        if vertex not in self._adjacency:
-            raise KeyError(f"Vertex {vertex} not found in graph")
-        return list(self._adjacency[vertex].keys())
+        names = self._names
+        return [names[j] for j in self._adjacency[self._id(vertex)]]
+    
+    def iter_vertices(self) -> Iterator[str]:
+        """
+        Iterate over all vertices without copying them into a list.
+        
+        The graph must not be modified during iteration.
+        
+        Returns:
+            Iterator over vertex identifiers
+        """
+        return iter(self._names)
+    
+    def iter_neighbors(self, vertex: str) -> Iterator[str]:
+        """
+        Iterate over the neighbors of a vertex without building a list.
+        
+        Prefer this over neighbors() in traversal inner loops. The graph must
+        not be modified during iteration.
+        
+        Args:
+            vertex: The vertex to query
+            
+        Returns:
+            Iterator over neighboring vertex identifiers
+            
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        return map(self._names.__getitem__, self._adjacency[self._id(vertex)])
+    
+    def neighbor_items(self, vertex: str) -> Iterator[Tuple[str, float]]:
+        """
+        Iterate over (neighbor, weight) pairs of a vertex.
+        
+        Avoids a separate weight() lookup per neighbor, e.g. in Dijkstra.
+        
+        Args:
+            vertex: The vertex to query
+            
+        Returns:
+            Iterator over (neighbor, weight) pairs
+        
+        Raises:
+            KeyError: If vertex does not exist in graph
+        """
+        names = self._names
+        return ((names[j], weight) for j, weight in self._adjacency[self._id(vertex)].items())
+    
+    def iter_edges(self) -> Iterator[Tuple[str, str, float]]:
+        """
+        Iterate over all edges, yielding the same tuples as edges().
+        
+        For undirected graphs an edge is reported from the endpoint that was
+        added first (the one with the smaller id).
+        
+        Returns:
+            Iterator over tuples (u, v, weight)
+        """
+        names = self._names
+        directed = self.directed
+        for i, row in enumerate(self._adjacency):
+            u = names[i]
+            for j, weight in row.items():
+                if directed or j >= i:
+                    yield (u, names[j], weight)
     
     def edges(self) -> List[Tuple[str, str, float]]:
         """
@@ -99,21 +316,35 @@ class Graph:
             List of tuples (u, v, weight) representing edges.
             For undirected graphs, each edge appears only once.
         """
-        edges = []
-        seen = set()
+        return list(self.iter_edges())
+    
+    def edge_arrays(self) -> Tuple[array, array, array]:
+        """
+        Get all edges as parallel arrays of vertex ids and weights.
         
-        for u in self._adjacency:
-            for v, weight in self._adjacency[u].items():
-                if self.directed:
-                    edges.append((u, v, weight))
-                else:
-                    # For undirected, only add each edge once
-                    edge_id = tuple(sorted([u, v]))
-                    if edge_id not in seen:
-                        edges.append((u, v, weight))
-                        seen.add(edge_id)
+        Edges are in the same order as iter_edges(), and for undirected
+        graphs each edge appears once, from the endpoint with the smaller
+        id. Much more compact than edges() for bulk work such as sorting
+        edges by weight.
         
-        return edges
+        Returns:
+            Tuple (src, dst, weights) of array('i'), array('i'), array('d')
+        """
+        src = array('i')
+        dst = array('i')
+        weights = array('d')
+        for i, row in enumerate(self._adjacency):
+            if self.directed:
+                src.extend(repeat(i, len(row)))
+                dst.extend(row.keys())
+                weights.extend(row.values())
+            else:
+                for j, weight in row.items():
+                    if j >= i:
+                        src.append(i)
+                        dst.append(j)
+                        weights.append(weight)
+        return src, dst, weights
     
     def weight(self, u: str, v: str) -> float:
         """
@@ -129,11 +360,11 @@ class Graph:
         Raises:
             KeyError: If the edge does not exist
         """
-        if u not in self._adjacency:
-            raise KeyError(f"Vertex {u} not found in graph")
-        if v not in self._adjacency[u]:
+        row = self._adjacency[self._id(u)]
+        j = self._ids.get(v)
+        if j is None or j not in row:
             raise KeyError(f"Edge ({u}, {v}) not found in graph")
-        return self._adjacency[u][v]
+        return row[j]
     
     def has_edge(self, u: str, v: str) -> bool:
         """
@@ -146,7 +377,21 @@ class Graph:
         Returns:
             True if edge exists, False otherwise
         """
-        return u in self._adjacency and v in self._adjacency[u]
+        i = self._ids.get(u)
+        j = self._ids.get(v)
+        return i is not None and j is not None and j in self._adjacency[i]
+    
+    def has_vertex(self, vertex: str) -> bool:
+        """
+        Check if a vertex exists, in O(1).
+        
+        Args:
+            vertex: The vertex to query
+            
+        Returns:
+            True if vertex exists, False otherwise
+        """
+        return vertex in self._ids
     
     def vertex_count(self) -> int:
         """
@@ -155,7 +400,7 @@ class Graph:
         Returns:
             Number of vertices in graph
         """
-        return len(self._adjacency)
+        return len(self._names)
     
     def edge_count(self) -> int:
         """
@@ -164,7 +409,15 @@ class Graph:
         Returns:
             Number of edges in graph
         """
-        return len(self.edges())
+        return self._edge_count
+    
+    def __contains__(self, vertex: str) -> bool:
+        """Support `vertex in graph` (same as has_vertex)."""
+        return vertex in self._ids
+    
+    def __len__(self) -> int:
+        """Support `len(graph)` (same as vertex_count)."""
+        return len(self._names)
     
     def __repr__(self) -> str:
         """String representation of the graph."""
@@ -4,30 +4,47 @@ Graph Loading Utilities - Instructor-provided infrastructure
 DO NOT EDIT THIS FILE
 Students should use these utilities but not modify them.
 
-This module provides utilities to load graphs from JSON and CSV files.
+This module provides utilities to load graphs from JSON and CSV files and
+from binary snapshots.
 """
 
 import json
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Union, Callable, Optional
 from pathlib import Path
 from .graph import Graph
+from .csr import CSRGraph, CSRBuilder
+from .snapshot import SNAPSHOT_SUFFIX, load_snapshot
+from .cache import GraphCache, default_cache
 
 
-def load_graph(filepath: str) -> Graph:
+def load_graph(filepath: str, csr: bool = False, stream: bool = False,
+               cache: Union[GraphCache, bool, None] = None) -> Union[Graph, CSRGraph]:
     """
     Load a graph from a file.
     
-    Automatically detects file format (JSON or CSV) and graph properties
-    (directed/undirected, weighted/unweighted).
+    Automatically detects file format (JSON, CSV or binary snapshot) and
+    graph properties (directed/undirected, weighted/unweighted). Snapshots
+    (.gbin, see graph.snapshot) are memory-mapped and always load as a
+    CSRGraph.
     
     Args:
         filepath: Path to the graph file
+        csr: If True, build a frozen CSRGraph instead of a Graph
+        stream: If True, parse JSON files incrementally (see stream_json_graph)
+        cache: A GraphCache to consult before parsing; None uses the cache
+            named by $GRAPH_CACHE_DIR for csr loads only, True requires
+            that cache, False disables caching. The cache stores CSR
+            snapshots: with csr False an explicitly requested cache thaws
+            the graph into a Graph (neighbors ordered by vertex id, not by
+            file order, and no faster than parsing small files).
         
     Returns:
-        A Graph object
+        A Graph object (or CSRGraph if csr is True)
         
     Raises:
-        ValueError: If file format is not supported
+        ValueError: If file format is not supported, or cache is True and
+            $GRAPH_CACHE_DIR is not set
         FileNotFoundError: If file does not exist
     """
     path = Path(filepath)
@@ -35,15 +52,38 @@ def load_graph(filepath: str) -> Graph:
     if not path.exists():
         raise FileNotFoundError(f"Graph file not found: {filepath}")
     
+    if path.suffix == SNAPSHOT_SUFFIX:
+        return load_snapshot(filepath)
+    
+    if cache is None:
+        # Only a CSRGraph comes back from the cache as is, so plain loads
+        # keep their file-order Graph whatever the environment says
+        cache = default_cache() if csr else None
+    elif cache is True:
+        cache = default_cache()
+        if cache is None:
+            raise ValueError("cache=True needs the GRAPH_CACHE_DIR environment variable; "
+                             "pass a GraphCache to use another directory")
+    # Snapshots are CSR, so a cached load parses straight to CSR
+    build_csr = csr or bool(cache)
+    
     if path.suffix == '.json':
-        return load_json_graph(filepath)
+        if stream:
+            parse = lambda p: stream_json_graph(p, csr=build_csr)
+        else:
+            parse = lambda p: load_json_graph(p, csr=build_csr)
     elif path.suffix == '.csv':
-        return load_csv_graph(filepath)
+        parse = lambda p: load_csv_graph(p, csr=build_csr)
     else:
         raise ValueError(f"Unsupported file format: {path.suffix}")
+    
+    if cache:
+        graph = cache.load(filepath, parse)
+        return graph if csr else graph.to_graph()
+    return parse(filepath)
 
 
-def load_json_graph(filepath: str) -> Graph:
+def load_json_graph(filepath: str, csr: bool = False) -> Union[Graph, CSRGraph]:
     """
     Load a graph from a JSON file.
     
@@ -63,9 +103,10 @@ def load_json_graph(filepath: str) -> Graph:
     
     Args:
         filepath: Path to JSON file
+        csr: If True, build a frozen CSRGraph instead of a Graph
         
     Returns:
-        A Graph object
+        A Graph object (or CSRGraph if csr is True)
     """
     with open(filepath, 'r') as f:
         data = json.load(f)
@@ -80,24 +121,188 @@ def load_json_graph(filepath: str) -> Graph:
     if not weighted and edges:
         weighted = any('weight' in edge for edge in edges)
     
-    # Create graph
-    graph = Graph(directed=directed, weighted=weighted)
+    # Create graph (or a CSR builder with the same edge insertion interface)
+    graph = CSRBuilder(directed=directed, weighted=weighted) if csr else Graph(directed=directed, weighted=weighted)
     
     # Add edges
-    for edge in edges:
-        u = str(edge['from'])
-        v = str(edge['to'])
-        weight = float(edge.get('weight', 1.0))
-        graph.add_edge(u, v, weight)
+    graph.add_edges_from((str(edge['from']), str(edge['to']), float(edge.get('weight', 1.0)))
+                         for edge in edges)
+    
+    if csr:
+        graph = graph.build()
+    
+    # Add blue vertices
+    if blue_vertices:
+        graph.blue = set(str(v) for v in blue_vertices)
+    
+    return graph
+
+
+class _JSONStream:
+    """
+    Minimal pull parser over a text file for the graph JSON layout.
+    
+    Keeps only an unconsumed window of the file in memory and decodes one
+    value at a time with json.JSONDecoder.raw_decode, reading more input
+    whenever a value is cut off at the end of the window.
+    """
+    
+    def __init__(self, f, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self) -> None:
+        """Drop the consumed prefix and append more input (at least doubling)."""
+        data = self._file.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not data:
+            self._eof = True
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if self._eof:
+                return ''
+            self._fill()
+    
+    def expect(self, char: str) -> None:
+        """Consume the given structural character or raise ValueError."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed graph JSON: expected '{char}', found '{found or 'end of file'}'")
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the window edge may be truncated
+                # (e.g. a number), so only trust it once more input is known
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+
+def stream_json_graph(filepath: str, csr: bool = False, chunk_size: int = 1 << 20,
+                      progress: Optional[Callable[[int, float], None]] = None,
+                      progress_every: int = 1_000_000) -> Union[Graph, CSRGraph]:
+    """
+    Load a graph from a JSON file without materializing the document.
+    
+    Accepts the same format as load_json_graph, but decodes the "edges"
+    array one record at a time and inserts each edge immediately, so the
+    only memory used beyond the graph itself is a read window of about
+    chunk_size characters. Combine with csr=True to keep the graph compact.
+    
+    "directed" must appear before "edges" if it is true, since edges are
+    inserted as they are read.
+    
+    Args:
+        filepath: Path to JSON file
+        csr: If True, build a frozen CSRGraph instead of a Graph
+        chunk_size: Number of characters read from the file at a time
+        progress: Optional callback progress(edges_loaded, elapsed_seconds),
+            called every progress_every edges and once at the end; divide
+            the two for throughput in edges/second
+        progress_every: Edge interval between progress callbacks
+        
+    Returns:
+        A Graph object (or CSRGraph if csr is True)
+        
+    Raises:
+        ValueError: If the file is not a JSON object or "directed" follows "edges"
+    """
+    started = time.perf_counter()
+    props: Dict[str, Any] = {}
+    graph = None
+    edge_count = 0
+    saw_weight = False
+    
+    def new_graph():
+        directed = bool(props.get('directed', False))
+        weighted = bool(props.get('weighted', False))
+        return CSRBuilder(directed=directed, weighted=weighted) if csr else Graph(directed=directed, weighted=weighted)
+    
+    def records(parser):
+        """Yield (u, v, weight) tuples from the "edges" array as they are decoded."""
+        nonlocal edge_count, saw_weight
+        parser.expect('[')
+        if parser.peek() == ']':
+            parser.expect(']')
+            return
+        while True:
+            edge = parser.value()
+            if 'weight' in edge:
+                saw_weight = True
+                yield (str(edge['from']), str(edge['to']), float(edge['weight']))
+            else:
+                yield (str(edge['from']), str(edge['to']))
+            edge_count += 1
+            if progress is not None and edge_count % progress_every == 0:
+                progress(edge_count, time.perf_counter() - started)
+            if parser.peek() == ',':
+                parser.expect(',')
+            else:
+                parser.expect(']')
+                return
+    
+    with open(filepath, 'r') as f:
+        parser = _JSONStream(f, chunk_size)
+        parser.expect('{')
+        more = parser.peek() != '}'
+        while more:
+            key = parser.value()
+            parser.expect(':')
+            if key == 'edges' and graph is None:
+                graph = new_graph()
+                graph.add_edges_from(records(parser))
+            else:
+                props[key] = parser.value()
+                if key == 'directed' and graph is not None and bool(props[key]) != graph.directed:
+                    raise ValueError("Streaming load requires \"directed\" to appear before \"edges\"")
+            more = parser.peek() == ','
+            if more:
+                parser.expect(',')
+        parser.expect('}')
+    
+    if graph is None:
+        graph = new_graph()
+    
+    # Auto-detect weighted if not specified
+    graph.weighted = bool(props.get('weighted', False)) or saw_weight
+    
+    if csr:
+        graph = graph.build()
     
     # Add blue vertices
+    blue_vertices = props.get('blue', [])
     if blue_vertices:
         graph.blue = set(str(v) for v in blue_vertices)
     
+    if progress is not None:
+        progress(edge_count, time.perf_counter() - started)
+    
     return graph
 
 
-def load_csv_graph(filepath: str) -> Graph:
+def load_csv_graph(filepath: str, csr: bool = False, chunk_size: int = 1 << 20) -> Union[Graph, CSRGraph]:
     """
     Load a graph from a CSV file.
     
@@ -109,48 +314,59 @@ def load_csv_graph(filepath: str) -> Graph:
     If no weight column, assumes unweighted graph with weight 1.0.
     Always assumes undirected unless specified in first line as comment.
     
+    The file is read in a single pass: columns are located once from the
+    header, and rows are parsed positionally and streamed straight into the
+    graph's bulk insertion, so memory beyond the graph itself stays flat.
+    
     Args:
         filepath: Path to CSV file
+        csr: If True, build a frozen CSRGraph instead of a Graph
+        chunk_size: Size in bytes of each read from the file
         
     Returns:
-        A Graph object
+        A Graph object (or CSRGraph if csr is True)
+        
+    Raises:
+        ValueError: If the header has no "from" or "to" column, or
+            chunk_size is less than 1
     """
     import csv
     
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    
     directed = False
-    weighted = False
-    edges = []
     
-    with open(filepath, 'r') as f:
+    with open(filepath, 'r', newline='', buffering=chunk_size) as f:
         # Check for directionality comment in first line
-        first_line = f.readline().strip()
-        if first_line.startswith('#'):
+        first_line = f.readline()
+        if first_line.strip().startswith('#'):
             if 'directed' in first_line.lower():
                 directed = True
-            # Reset to beginning after comment
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
         else:
             # First line is header, reset file
             f.seek(0)
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
         
-        for row in reader:
-            u = str(row['from'])
-            v = str(row['to'])
-            
-            if 'weight' in row:
-                weighted = True
-                weight = float(row['weight'])
-            else:
-                weight = 1.0
-            
-            edges.append((u, v, weight))
-    
-    # Create graph
-    graph = Graph(directed=directed, weighted=weighted)
+        header = [name.strip() for name in next(reader, [])]
+        if 'from' not in header or 'to' not in header:
+            raise ValueError(f"CSV header must contain 'from' and 'to' columns: {filepath}")
+        ui = header.index('from')
+        vi = header.index('to')
+        wi = header.index('weight') if 'weight' in header else None
+        
+        # Create graph (or a CSR builder with the same edge insertion interface)
+        graph = CSRBuilder(directed=directed) if csr else Graph(directed=directed)
+        
+        if wi is None:
+            graph.add_edges_from((row[ui], row[vi]) for row in reader if row)
+        else:
+            graph.add_edges_from((row[ui], row[vi], float(row[wi])) for row in reader if row)
+        
+        graph.weighted = wi is not None and graph.vertex_count() > 0
     
-    # Add edges
-    for u, v, weight in edges:
-        graph.add_edge(u, v, weight)
+    if csr:
+        graph = graph.build()
     
     return graph
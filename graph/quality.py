@@ -0,0 +1,184 @@
+"""
+Partition Quality - Instructor-provided infrastructure
+
+DO NOT EDIT THIS FILE
+Students should use these utilities but not modify them.
+
+This module scores community detection results (Task 3, option B). A
+partition is handled as a flat list of community labels indexed by vertex
+id, so that every metric is a single pass over vertex ids and arcs:
+
+- partition_labels() checks a list of communities and converts it
+- partition_quality() computes modularity, coverage and conductance in one
+  O(V + E) pass over the adjacency
+- compare_partitions() computes NMI and ARI between two label lists in O(V)
+
+Directed graphs are scored as undirected (each arc counts as an edge), and
+edge weights are used only for weighted graphs.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence
+
+
+def partition_labels(graph, communities: Iterable[Iterable[str]]) -> List[int]:
+    """
+    Convert communities of vertex names into a label per vertex id.
+
+    Args:
+        graph: The graph (Graph or CSRGraph)
+        communities: Iterable of communities, each an iterable of vertex names
+
+    Returns:
+        A list where entry i is the index of the community containing the
+        vertex with id i
+
+    Raises:
+        ValueError: If a vertex is unknown, in more than one community, or
+            in none
+    """
+    labels = [-1] * graph.vertex_count()
+    vertex_id = graph.vertex_id
+    for c, community in enumerate(communities):
+        for vertex in community:
+            try:
+                i = vertex_id(vertex)
+            except KeyError:
+                raise ValueError(f"Unknown vertex {vertex!r} in community {c}") from None
+            if labels[i] >= 0:
+                raise ValueError(f"Communities overlap (vertex {vertex!r} in communities {labels[i]} and {c})")
+            labels[i] = c
+    if -1 in labels:
+        missing = labels.count(-1)
+        example = graph.vertex_name(labels.index(-1))
+        raise ValueError(f"{missing} vertices not assigned to a community (e.g. {example!r})")
+    return labels
+
+
+def partition_quality(graph, labels: Sequence[int]) -> Dict[str, float]:
+    """
+    Score a partition of the graph.
+
+    One pass over the arcs accumulates, per community, its volume (sum of
+    vertex degrees) and its internal weight (edges inside it, counted from
+    both ends); everything else follows from those two arrays.
+
+    Args:
+        graph: The graph (Graph or CSRGraph)
+        labels: Community label (0, 1, ...) of every vertex id
+
+    Returns:
+        Dict with
+        'communities': number of distinct labels,
+        'modularity': Newman-Girvan modularity,
+        'coverage': fraction of edge weight inside communities,
+        'conductance': mean conductance (cut / smaller side volume) over
+        communities with edges on both sides, 0.0 if there are none,
+        'max_conductance': the largest of those conductances
+    """
+    n = graph.vertex_count()
+    count = max(labels) + 1 if n else 0
+    volume = [0.0] * count
+    internal = [0.0] * count
+    directed = graph.directed
+    weighted = graph.weighted
+    get_label = labels.__getitem__
+
+    if not directed and not weighted:
+        # Unit weights: a row's contribution is its length and a count
+        neighbor_ids = graph.neighbor_ids
+        for i in range(n):
+            ci = labels[i]
+            row = neighbor_ids(i)
+            same = list(map(get_label, row)).count(ci)
+            degree = len(row)
+            if i in row:
+                # A self-loop is stored once but adds 2 to the degree
+                same += 1
+                degree += 1
+            volume[ci] += degree
+            internal[ci] += same
+    else:
+        neighbor_id_items = graph.neighbor_id_items
+        for i in range(n):
+            ci = labels[i]
+            for j, w in neighbor_id_items(i):
+                if not weighted:
+                    w = 1.0
+                cj = labels[j]
+                if directed or i == j:
+                    # Seen once: add the edge at both ends
+                    volume[ci] += w
+                    volume[cj] += w
+                    if ci == cj:
+                        internal[ci] += 2 * w
+                else:
+                    volume[ci] += w
+                    if ci == cj:
+                        internal[ci] += w
+
+    total = sum(volume)
+    modularity = 0.0
+    coverage = 0.0
+    conductances = []
+    if total:
+        for vol, inside in zip(volume, internal):
+            modularity += inside / total - (vol / total) ** 2
+            side = min(vol, total - vol)
+            if side > 0:
+                conductances.append((vol - inside) / side)
+        coverage = sum(internal) / total
+    return {
+        'communities': len(set(labels)),
+        'modularity': modularity,
+        'coverage': coverage,
+        'conductance': sum(conductances) / len(conductances) if conductances else 0.0,
+        'max_conductance': max(conductances, default=0.0),
+    }
+
+
+def compare_partitions(a: Sequence[int], b: Sequence[int]) -> Dict[str, float]:
+    """
+    Measure the agreement of two partitions of the same vertices.
+
+    Args:
+        a: Community label of every vertex id in the first partition
+        b: Community label of every vertex id in the second partition
+
+    Returns:
+        Dict with 'nmi' (normalized mutual information, arithmetic-mean
+        normalization) and 'ari' (adjusted Rand index); both are 1.0 for
+        identical partitions
+
+    Raises:
+        ValueError: If the label lists have different lengths
+    """
+    if len(a) != len(b):
+        raise ValueError("Partitions must cover the same vertices")
+    n = len(a)
+    if not n:
+        return {'nmi': 1.0, 'ari': 1.0}
+
+    joint = Counter(zip(a, b))
+    sizes_a = Counter(a)
+    sizes_b = Counter(b)
+
+    def entropy(sizes):
+        return -sum(s / n * math.log(s / n) for s in sizes.values())
+
+    h_a = entropy(sizes_a)
+    h_b = entropy(sizes_b)
+    mutual = sum(s / n * math.log(s * n / (sizes_a[x] * sizes_b[y])) for (x, y), s in joint.items())
+    nmi = 2 * mutual / (h_a + h_b) if h_a + h_b else 1.0
+
+    def pairs(sizes):
+        return sum(s * (s - 1) / 2 for s in sizes)
+
+    index = pairs(joint.values())
+    pairs_a = pairs(sizes_a.values())
+    pairs_b = pairs(sizes_b.values())
+    expected = pairs_a * pairs_b / (n * (n - 1) / 2) if n > 1 else 0.0
+    largest = (pairs_a + pairs_b) / 2
+    ari = (index - expected) / (largest - expected) if largest != expected else 1.0
+    return {'nmi': min(max(nmi, 0.0), 1.0), 'ari': ari}
@@ -17,8 +17,20 @@ In other words:
 The graph will have a "blue" attribute on vertices (a set of vertex names).
 """
 
-from graph import Graph
-from typing import Set
+import time
+from array import array
+from collections import OrderedDict
+from graph import Graph, bfs_max_marked
+from typing import Set, List, Dict, Tuple, Iterable, Optional, Callable, Any
+
+
+def _blue_mask(graph: Graph) -> bytearray:
+    """Return a per-vertex-id 0/1 array marking the blue vertices."""
+    is_blue = bytearray(graph.vertex_count())
+    for name in graph.blue:
+        if name in graph:
+            is_blue[graph.vertex_id(name)] = 1
+    return is_blue
 
 
 def max_blue_path(graph: Graph, s: str, t: str) -> int:
@@ -42,8 +54,286 @@ def max_blue_path(graph: Graph, s: str, t: str) -> int:
         - Find the shorts path(s) using (single) BFS
         - Count blue vertices along the maximal blue shortest path. 
     """
-    # TODO: Implement maximal blue nodes on shortest paths from s to t.
-    # Hints:
-    # 1. Use BFS to find distance from s to all vertices.
-    # Figure out how to do it in one go. 
-    pass
+    source = graph.vertex_id(s)
+    target = graph.vertex_id(t)
+    dist, best = bfs_max_marked(graph, source, _blue_mask(graph), {target})
+    return best[target] if dist[target] >= 0 else 0
+
+
+def _expand_level(graph: Graph, frontier: Dict[int, int], seen: Dict[int, int],
+                  is_blue: Callable[[int], int]) -> Dict[int, int]:
+    """
+    Discover the next BFS level of one side of a bidirectional search.
+    
+    Args:
+        graph: The graph (Graph or CSRGraph)
+        frontier: Current level, vertex id -> best blue count
+        seen: Every vertex discovered so far on this side; updated in place
+        is_blue: Returns 1 if the vertex with the given id is blue, else 0
+    
+    Returns:
+        The next level, vertex id -> best blue count (over all predecessors)
+    """
+    neighbor_ids = graph.neighbor_ids
+    next_frontier: Dict[int, int] = {}
+    get = next_frontier.get
+    for u, bu in frontier.items():
+        for v in neighbor_ids(u):
+            if v not in seen and get(v, -1) < bu:
+                next_frontier[v] = bu
+    for v in next_frontier:
+        next_frontier[v] += is_blue(v)
+    seen.update(next_frontier)
+    return next_frontier
+
+
+def max_blue_path_bidirectional(graph: Graph, s: str, t: str) -> int:
+    """
+    Same as max_blue_path, but searching from both ends at once.
+    
+    Whole BFS levels are expanded alternately from s and from t, always on
+    the side with the smaller frontier, until a new level touches the other
+    side's frontier. Every shortest path crosses that meeting layer exactly
+    once, so the answer is the best forward count plus the best backward
+    count over the meeting vertices (minus the meeting vertex, counted
+    twice). On large sparse graphs this visits far fewer vertices than a
+    full BFS from s.
+    
+    Directed graphs would need incoming adjacency, which Graph does not
+    keep, so they fall back to max_blue_path.
+    
+    Args:
+        graph: The input graph with a 'blue' attribute (set of blue vertex names)
+        s: Source vertex
+        t: Target vertex
+    
+    Returns:
+        The maximum number of blue vertices on any shortest path from s to t,
+        or 0 if no path exists
+    
+    Raises:
+        KeyError: If source or target vertex does not exist in graph
+    """
+    source = graph.vertex_id(s)
+    target = graph.vertex_id(t)
+    if graph.directed:
+        return max_blue_path(graph, s, t)
+    
+    # Look blue status up by name so only visited vertices are ever checked
+    blue = graph.blue
+    vertex_name = graph.vertex_name
+    
+    def is_blue(v: int) -> int:
+        return 1 if vertex_name(v) in blue else 0
+    
+    if source == target:
+        return is_blue(source)
+    
+    forward = {source: is_blue(source)}
+    backward = {target: is_blue(target)}
+    seen_forward = dict(forward)
+    seen_backward = dict(backward)
+    while forward and backward:
+        if len(forward) <= len(backward):
+            forward = _expand_level(graph, forward, seen_forward, is_blue)
+            level, other = forward, backward
+        else:
+            backward = _expand_level(graph, backward, seen_backward, is_blue)
+            level, other = backward, forward
+        
+        # Before this level the two sides were disjoint, so a new vertex can
+        # only meet the other side on its current frontier
+        meet = [v for v in level if v in other]
+        if meet:
+            return max(level[v] + other[v] - is_blue(v) for v in meet)
+    
+    return 0
+
+
+def max_blue_paths(graph: Graph, queries: Iterable[Tuple[str, str]]) -> List[int]:
+    """
+    Answer many max_blue_path queries against the same graph.
+    
+    Queries are grouped by source and each distinct source gets a single
+    BFS that stops once all of its targets are settled, so the cost grows
+    with the number of distinct sources rather than the number of queries.
+    
+    Args:
+        graph: The input graph with a 'blue' attribute
+        queries: Iterable of (s, t) pairs
+    
+    Returns:
+        A list with max_blue_path(graph, s, t) for each query, in order
+        (use dict(zip(queries, results)) for a lookup table)
+    
+    Raises:
+        KeyError: If any source or target vertex does not exist in graph
+    """
+    pairs = [(graph.vertex_id(s), graph.vertex_id(t)) for s, t in queries]
+    by_source: Dict[int, Set[int]] = {}
+    for source, target in pairs:
+        by_source.setdefault(source, set()).add(target)
+    
+    is_blue = _blue_mask(graph)
+    answers: Dict[Tuple[int, int], int] = {}
+    for source, targets in by_source.items():
+        dist, best = bfs_max_marked(graph, source, is_blue, targets)
+        for target in targets:
+            answers[(source, target)] = best[target] if dist[target] >= 0 else 0
+    
+    return [answers[pair] for pair in pairs]
+
+
+class BlueDistanceIndex:
+    """
+    Precomputed max_blue_path answers for a fixed graph and blue set.
+    
+    The index stores BFS rows (distance and best blue count from one source
+    to every vertex, as compact int arrays of 8 bytes per vertex) within a
+    memory budget:
+    
+    - If rows for every vertex fit, all of them are built up front and
+      every query is a table lookup (all-pairs mode).
+    - Otherwise rows are built on demand and the least recently used ones
+      are dropped once the budget is full (cached mode). Rows for the
+      given warm-up sources are built up front.
+    
+    On undirected graphs a query (s, t) can also be answered from t's row,
+    since max blue counts are symmetric.
+    
+    The index does not notice later changes to the graph or its blue set;
+    build a new one after modifying either.
+    
+    Attributes:
+        build_time (float): Seconds spent building rows in the constructor
+        capacity (int): Number of rows that fit in the memory budget
+    """
+    
+    def __init__(self, graph: Graph, max_bytes: int = 64 << 20,
+                 sources: Optional[Iterable[str]] = None):
+        """
+        Build the index.
+        
+        Args:
+            graph: The input graph with a 'blue' attribute
+            max_bytes: Memory budget for the stored rows
+            sources: Vertices whose rows to build up front in cached mode
+                (e.g. the expected frequent sources); ignored in all-pairs mode
+        
+        Raises:
+            KeyError: If a warm-up source does not exist in graph
+        """
+        self.graph = graph
+        self._is_blue = _blue_mask(graph)
+        n = graph.vertex_count()
+        self._row_bytes = 2 * array('i').itemsize * max(n, 1)
+        self.capacity = max_bytes // self._row_bytes
+        self._rows: 'OrderedDict[int, Tuple[array, array]]' = OrderedDict()
+        self._queries = 0
+        self._hits = 0
+        self._query_time = 0.0
+        
+        start = time.perf_counter()
+        if self.capacity >= n:
+            for source in range(n):
+                self._build_row(source)
+        elif sources is not None:
+            for name in sources:
+                self._row(graph.vertex_id(name))
+        self.build_time = time.perf_counter() - start
+    
+    @property
+    def all_pairs(self) -> bool:
+        """True if rows for every vertex are stored."""
+        return self.capacity >= self.graph.vertex_count()
+    
+    def _build_row(self, source: int) -> Tuple[array, array]:
+        """Run a full BFS from source and store its row."""
+        dist, best = bfs_max_marked(self.graph, source, self._is_blue)
+        row = (array('i', dist), array('i', best))
+        self._rows[source] = row
+        if len(self._rows) > self.capacity:
+            self._rows.popitem(last=False)
+        return row
+    
+    def _row(self, source: int) -> Tuple[array, array]:
+        """Get the row of source, building it on a miss."""
+        row = self._rows.get(source)
+        if row is None:
+            return self._build_row(source)
+        self._rows.move_to_end(source)
+        return row
+    
+    def query(self, s: str, t: str) -> int:
+        """
+        Look up max_blue_path(graph, s, t).
+        
+        Args:
+            s: Source vertex
+            t: Target vertex
+        
+        Returns:
+            The maximum number of blue vertices on any shortest path from s
+            to t, or 0 if no path exists
+        
+        Raises:
+            KeyError: If source or target vertex does not exist in graph
+        """
+        start = time.perf_counter()
+        source = self.graph.vertex_id(s)
+        target = self.graph.vertex_id(t)
+        rows = self._rows
+        if source in rows:
+            rows.move_to_end(source)
+            self._hits += 1
+            dist, best = rows[source]
+            key = target
+        elif not self.graph.directed and target in rows:
+            rows.move_to_end(target)
+            self._hits += 1
+            dist, best = rows[target]
+            key = source
+        else:
+            dist, best = self._build_row(source)
+            key = target
+        answer = best[key] if dist[key] >= 0 else 0
+        self._queries += 1
+        self._query_time += time.perf_counter() - start
+        return answer
+    
+    def query_many(self, queries: Iterable[Tuple[str, str]]) -> List[int]:
+        """
+        Look up many (s, t) pairs.
+        
+        Args:
+            queries: Iterable of (s, t) pairs
+        
+        Returns:
+            A list with query(s, t) for each pair, in order
+        """
+        return [self.query(s, t) for s, t in queries]
+    
+    def nbytes(self) -> int:
+        """Approximate memory held by the stored rows, in bytes."""
+        return len(self._rows) * self._row_bytes
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the build-time vs. query-time tradeoff so far.
+        
+        Returns:
+            Dict with mode, rows, capacity, nbytes, build_time, queries,
+            hits (answered without a BFS), query_time and mean_query_time
+            (both in seconds, including BFS on misses)
+        """
+        return {
+            'mode': 'all-pairs' if self.all_pairs else 'cached',
+            'rows': len(self._rows),
+            'capacity': self.capacity,
+            'nbytes': self.nbytes(),
+            'build_time': self.build_time,
+            'queries': self._queries,
+            'hits': self._hits,
+            'query_time': self._query_time,
+            'mean_query_time': self._query_time / self._queries if self._queries else 0.0,
+        }
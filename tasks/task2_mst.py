@@ -14,8 +14,36 @@ Implement two functions:
 You may implement Union-Find in this file or use the example from examples/union_find_example.py
 """
 
+import math
+import os
+from array import array
+from itertools import compress
+from multiprocessing import Pool
 from graph import Graph
-from typing import List, Tuple, Optional
+from graph.shared import SharedArray, attach_array
+from examples.union_find_example import ArrayUnionFind
+from typing import Dict, Iterable, List, Set, Tuple, Optional
+
+
+def _kruskal(graph: Graph) -> Tuple[array, array, array, List[int]]:
+    """
+    Kruskal's algorithm on vertex ids.
+    
+    Edges come from graph.edge_arrays(); only a permutation of edge
+    positions is sorted (by weight), and the sorted endpoints are streamed
+    into ArrayUnionFind.union_many, which stops once the tree spans the
+    graph. Self-loops never merge two sets, so they need no filtering.
+    
+    Returns:
+        Tuple (src, dst, weights, tree): the edge arrays and the positions
+        of the spanning forest edges in them, by increasing weight
+    """
+    src, dst, weights = graph.edge_arrays()
+    values = weights.tolist()
+    order = sorted(range(len(values)), key=values.__getitem__)
+    merged = ArrayUnionFind(graph.vertex_count()).union_many(map(src.__getitem__, order),
+                                                              map(dst.__getitem__, order))
+    return src, dst, weights, [order[k] for k in merged]
 
 
 def MST(graph: Graph) -> List[Tuple[str, str, float]]:
@@ -35,9 +63,324 @@ def MST(graph: Graph) -> List[Tuple[str, str, float]]:
         If the graph is disconnected, returns a minimum spanning forest.
         You may use Kruskal's, Prim's, or any other MST algorithm.
     """
-    # TODO: Implement MST algorithm (Kruskal's recommended)
-    # Hint: Sort edges by weight, use Union-Find to detect cycles
-    pass
+    if graph.directed:
+        raise ValueError("MST requires an undirected graph")
+    
+    src, dst, weights, tree = _kruskal(graph)
+    name = graph.vertex_name
+    return [(name(src[k]), name(dst[k]), weights[k]) for k in tree]
+
+
+def _cheapest_edges(src, dst, weights, comp, alive) -> Tuple[array, array, array]:
+    """
+    One Borůvka scan: the cheapest edge leaving each component.
+    
+    Edges are compared by (weight, position), a total order, so the
+    minimum spanning forest is unique and equal to the one Kruskal's
+    stable sort picks. alive must be in increasing position order, so a
+    strictly smaller weight is enough to replace an earlier candidate.
+    
+    Args:
+        src, dst, weights: Edge arrays (as from edge_arrays())
+        comp: Component label (a vertex id) of every vertex id
+        alive: Positions of the edges to scan
+    
+    Returns:
+        Tuple (comps, edges, survivors): the components that have an
+        outgoing edge, the position of the cheapest one for each, and the
+        scanned positions that join two different components
+    """
+    n = len(comp)
+    best = [-1] * n
+    best_weight = [math.inf] * n
+    survivors = array('i')
+    keep = survivors.append
+    for k in alive:
+        cu = comp[src[k]]
+        cv = comp[dst[k]]
+        if cu == cv:
+            continue
+        keep(k)
+        w = weights[k]
+        if w < best_weight[cu]:
+            best_weight[cu] = w
+            best[cu] = k
+        if w < best_weight[cv]:
+            best_weight[cv] = w
+            best[cv] = k
+    found = [k >= 0 for k in best]
+    return array('i', compress(range(n), found)), array('i', compress(best, found)), survivors
+
+
+# Borůvka arrays opened by each pool worker (see _init_boruvka_worker)
+_worker_edges = None
+
+
+def _init_boruvka_worker(blocks: List[Tuple[str, str, int]]) -> None:
+    """Pool initializer: attach the shared (src, dst, weights, comp, alive) arrays."""
+    global _worker_edges
+    _worker_edges = [attach_array(name, typecode, length) for name, typecode, length in blocks]
+
+
+def _int_array(data: bytes) -> array:
+    """Unpack bytes produced by array('i').tobytes()."""
+    values = array('i')
+    values.frombytes(data)
+    return values
+
+
+def _cheapest_chunk(task: Tuple[int, int]) -> Tuple[bytes, bytes, bytes]:
+    """Pool task: _cheapest_edges over alive[lo:hi], packed as bytes."""
+    lo, hi = task
+    src, dst, weights, comp, alive = _worker_edges
+    return tuple(part.tobytes() for part in _cheapest_edges(src, dst, weights, comp, alive[lo:hi]))
+
+
+def _boruvka(graph: Graph, processes: Optional[int] = None,
+             chunks_per_process: int = 4) -> Tuple[array, array, array, List[int]]:
+    """
+    Borůvka's algorithm on vertex ids.
+    
+    Each round finds the cheapest edge leaving every component, adds those
+    edges and merges the components, then keeps only the edges that still
+    leave a component; there are at most log2(V) rounds. With processes
+    set, the edge arrays, component labels and surviving edge positions are
+    placed in shared memory and each round's scan is split into ranges of
+    surviving edges handled by the workers; the parent merges their
+    per-component candidates, the unions and the relabelling.
+    
+    Returns:
+        Tuple (src, dst, weights, tree) as for _kruskal, with the same tree
+        in the same (increasing weight) order
+    """
+    src, dst, stored = graph.edge_arrays()
+    # Widen float32 storage (or a memoryview, which has no typecode) to float64
+    weights = stored if getattr(stored, 'typecode', None) == 'd' else array('d', stored)
+    n = graph.vertex_count()
+    m = len(src)
+    sets = ArrayUnionFind(n)
+    tree: List[int] = []
+    
+    def merge(edges) -> None:
+        for k in edges:
+            if sets.union(src[k], dst[k]):
+                tree.append(k)
+    
+    if processes is None:
+        comp = array('i', range(n))
+        alive = array('i', range(m))
+        while True:
+            _, edges, alive = _cheapest_edges(src, dst, weights, comp, alive)
+            if not edges:
+                break
+            merge(edges)
+            comp = array('i', map(sets.find, range(n)))
+    else:
+        processes = processes or os.cpu_count() or 1
+        with SharedArray('i', src) as shared_src, SharedArray('i', dst) as shared_dst, \
+                SharedArray('d', weights) as shared_weights, SharedArray('i', range(n)) as shared_comp, \
+                SharedArray('i', range(m)) as shared_alive:
+            blocks = [(shared.name, shared.typecode, len(shared.values))
+                      for shared in (shared_src, shared_dst, shared_weights, shared_comp, shared_alive)]
+            with Pool(processes, initializer=_init_boruvka_worker, initargs=(blocks,)) as pool:
+                count = m
+                while True:
+                    step = max(1, -(-count // (processes * chunks_per_process)))
+                    tasks = [(lo, min(lo + step, count)) for lo in range(0, count, step)]
+                    best: Dict[int, int] = {}
+                    survivors = array('i')
+                    # Chunks come back in order, so ties still go to the lower position
+                    for data in pool.imap(_cheapest_chunk, tasks):
+                        comps, edges, kept = map(_int_array, data)
+                        for c, k in zip(comps, edges):
+                            b = best.get(c)
+                            if b is None or weights[k] < weights[b]:
+                                best[c] = k
+                        survivors.extend(kept)
+                    if not best:
+                        break
+                    merge(best.values())
+                    count = len(survivors)
+                    shared_alive.values[:count] = survivors
+                    shared_comp.values[:] = array('i', map(sets.find, range(n)))
+    
+    tree.sort(key=lambda k: (weights[k], k))
+    return src, dst, stored, tree
+
+
+def MST_boruvka(graph: Graph, processes: Optional[int] = None) -> List[Tuple[str, str, float]]:
+    """
+    Find a minimum spanning tree with Borůvka's algorithm.
+    
+    Returns exactly what MST() returns (ties between equal weights are
+    broken by edge order in both), but each round is a scan over the
+    remaining edges that can be split across processes instead of one
+    global sort.
+    
+    Args:
+        graph: An undirected, weighted graph
+        processes: If given, scan the edges on a process pool with this
+            many workers (0 for all cores)
+    
+    Returns:
+        A list of edges (u, v, weight) that form the MST (or forest)
+    
+    Raises:
+        ValueError: If graph is directed
+    """
+    if graph.directed:
+        raise ValueError("MST requires an undirected graph")
+    
+    src, dst, weights, tree = _boruvka(graph, processes)
+    name = graph.vertex_name
+    return [(name(src[k]), name(dst[k]), weights[k]) for k in tree]
+
+
+def _top_two(a1: float, a2: float, b1: float, b2: float) -> Tuple[float, float]:
+    """Largest and strictly second-largest value of two such pairs (-inf if missing)."""
+    if a1 > b1:
+        return a1, (a2 if a2 > b1 else b1)
+    if b1 > a1:
+        return b1, (b2 if b2 > a1 else a1)
+    return a1, (a2 if a2 > b2 else b2)
+
+
+class _PathMaxima:
+    """
+    Largest and strictly second-largest edge weight on paths of a spanning
+    forest, by binary lifting.
+    
+    Each tree is rooted at its smallest vertex id. For level j, up[j][v] is
+    the 2^j-th ancestor of v (the root is its own parent), and first[j][v],
+    second[j][v] are the two largest distinct weights on the edges climbed
+    to get there. Building takes O(V log V); a query takes O(log V).
+    """
+    
+    def __init__(self, n: int, src, dst, weights, tree: List[int]):
+        """
+        Root the forest and build the lifting tables.
+        
+        Args:
+            n: Number of vertices
+            src, dst, weights: Edge arrays
+            tree: Positions of the forest edges
+        """
+        adjacency: List[List[int]] = [[] for _ in range(n)]
+        for k in tree:
+            adjacency[src[k]].append(k)
+            adjacency[dst[k]].append(k)
+        parent = array('i', range(n))
+        parent_edge = array('i', [-1]) * n
+        depth = array('i', bytes(4 * n))
+        up_weight = [-math.inf] * n
+        seen = bytearray(n)
+        for root in range(n):
+            if seen[root]:
+                continue
+            seen[root] = 1
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for u in frontier:
+                    for k in adjacency[u]:
+                        v = src[k] if dst[k] == u else dst[k]
+                        if not seen[v]:
+                            seen[v] = 1
+                            parent[v] = u
+                            parent_edge[v] = k
+                            depth[v] = depth[u] + 1
+                            up_weight[v] = weights[k]
+                            next_frontier.append(v)
+                frontier = next_frontier
+        
+        self.depth = depth
+        self.parent_edge = parent_edge
+        self.up = [parent]
+        self.first = [up_weight]
+        self.second = [[-math.inf] * n]
+        for _ in range(1, max(max(depth, default=0).bit_length(), 1)):
+            up, first, second = self.up[-1], self.first[-1], self.second[-1]
+            self.up.append(array('i', map(up.__getitem__, up)))
+            pairs = [_top_two(first[v], second[v], first[mid], second[mid]) for v, mid in enumerate(up)]
+            self.first.append([pair[0] for pair in pairs])
+            self.second.append([pair[1] for pair in pairs])
+    
+    def query(self, u: int, v: int) -> Tuple[float, float]:
+        """
+        Two largest distinct edge weights on the tree path between u and v.
+        
+        Args:
+            u, v: Vertex ids in the same tree
+        
+        Returns:
+            Tuple (largest, strictly second largest), -inf where missing
+        """
+        depth, up, first, second = self.depth, self.up, self.first, self.second
+        if depth[u] < depth[v]:
+            u, v = v, u
+        m1 = m2 = -math.inf
+        diff = depth[u] - depth[v]
+        j = 0
+        while diff:
+            if diff & 1:
+                m1, m2 = _top_two(m1, m2, first[j][u], second[j][u])
+                u = up[j][u]
+            diff >>= 1
+            j += 1
+        if u == v:
+            return m1, m2
+        for j in range(len(up) - 1, -1, -1):
+            if up[j][u] != up[j][v]:
+                m1, m2 = _top_two(m1, m2, first[j][u], second[j][u])
+                m1, m2 = _top_two(m1, m2, first[j][v], second[j][v])
+                u = up[j][u]
+                v = up[j][v]
+        m1, m2 = _top_two(m1, m2, first[0][u], second[0][u])
+        return _top_two(m1, m2, first[0][v], second[0][v])
+    
+    def edge_on_path(self, u: int, v: int, weights, weight: float) -> int:
+        """Position of a tree edge with the given weight on the path between u and v, in O(V)."""
+        depth, parent, parent_edge = self.depth, self.up[0], self.parent_edge
+        while u != v:
+            if depth[u] < depth[v]:
+                u, v = v, u
+            k = parent_edge[u]
+            if weights[k] == weight:
+                return k
+            u = parent[u]
+        raise ValueError("No edge of that weight on the path")
+
+
+def _best_swap(paths: _PathMaxima, src, dst, weights, candidates: Iterable[int]) -> Tuple[float, int, float]:
+    """
+    Cheapest way to make a spanning forest strictly heavier by one swap.
+    
+    Swapping non-tree edge (u, v, w) for the heaviest tree edge on the u-v
+    path costs w - max; when w equals that maximum the swap is free, so
+    the strictly smaller second maximum is dropped instead.
+    
+    Args:
+        paths: Path maxima of the forest
+        src, dst, weights: Edge arrays
+        candidates: Positions of the non-tree edges to try (no self-loops)
+    
+    Returns:
+        Tuple (increase, edge, drop): the weight increase, the edge to add
+        and the weight of the tree edge to remove; (inf, -1, -inf) if no
+        swap makes the forest strictly heavier
+    """
+    best_increase = math.inf
+    best_edge = -1
+    best_drop = -math.inf
+    for k in candidates:
+        w = weights[k]
+        first, second = paths.query(src[k], dst[k])
+        drop = first if w > first else second
+        if drop != -math.inf and w - drop < best_increase:
+            best_increase = w - drop
+            best_edge = k
+            best_drop = drop
+    return best_increase, best_edge, best_drop
 
 
 def second_best_ST(graph: Graph) -> Optional[List[Tuple[str, str, float]]]:
@@ -65,8 +408,493 @@ def second_best_ST(graph: Graph) -> Optional[List[Tuple[str, str, float]]]:
         4. This gives a candidate spanning tree
         5. Return the candidate with minimum weight
     """
-    # TODO: Implement second-best spanning tree algorithm
-    pass
+    if graph.directed:
+        raise ValueError("Second-best spanning tree requires an undirected graph")
+    
+    # Build the MST once, then price every non-tree edge by a path query
+    src, dst, weights, tree = _kruskal(graph)
+    in_tree = bytearray(len(src))
+    for k in tree:
+        in_tree[k] = 1
+    paths = _PathMaxima(graph.vertex_count(), src, dst, weights, tree)
+    
+    candidates = (k for k in range(len(src)) if not in_tree[k] and src[k] != dst[k])
+    _, best_edge, best_drop = _best_swap(paths, src, dst, weights, candidates)
+    if best_edge < 0:
+        return None
+    
+    removed = paths.edge_on_path(src[best_edge], dst[best_edge], weights, best_drop)
+    name = graph.vertex_name
+    return [(name(src[k]), name(dst[k]), weights[k]) for k in tree if k != removed] + \
+        [(name(src[best_edge]), name(dst[best_edge]), weights[best_edge])]
+
+
+class _LinkCutForest:
+    """
+    Link-cut trees (Sleator and Tarjan) with path maxima.
+    
+    A dynamic forest of nodes, each with a weight and a tie-breaking key.
+    link, cut, connected and path queries take O(log N) amortized time.
+    Every splay-tree node also keeps, for its subtree, the node with the
+    largest (weight, key) and the two largest distinct weights. So a path
+    query returns the heaviest node on the path plus the path's top two
+    weights.
+    """
+    
+    def __init__(self):
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.parent: List[int] = []
+        self.flip: List[bool] = []
+        self.weight: List[float] = []
+        self.key: List[int] = []
+        self.top: List[int] = []
+        self.first: List[float] = []
+        self.second: List[float] = []
+    
+    def add_node(self, weight: float = -math.inf, key: int = -1) -> int:
+        """Add an isolated node and return its index."""
+        x = len(self.left)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.weight.append(weight)
+        self.key.append(key)
+        self.top.append(x)
+        self.first.append(weight)
+        self.second.append(-math.inf)
+        return x
+    
+    def _is_root(self, x: int) -> bool:
+        """Whether x is the root of its splay tree."""
+        p = self.parent[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+    
+    def _push(self, x: int) -> None:
+        """Apply a pending subtree reversal at x to its children."""
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left >= 0:
+                self.flip[left] = not self.flip[left]
+            if right >= 0:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+    
+    def _pull(self, x: int) -> None:
+        """Recompute the subtree aggregates of x from its children."""
+        weight, key, top, first, second = self.weight, self.key, self.top, self.first, self.second
+        t = x
+        f1 = weight[x]
+        f2 = -math.inf
+        for c in (self.left[x], self.right[x]):
+            if c >= 0:
+                tc = top[c]
+                if weight[tc] > weight[t] or (weight[tc] == weight[t] and key[tc] > key[t]):
+                    t = tc
+                f1, f2 = _top_two(f1, f2, first[c], second[c])
+        top[x] = t
+        first[x] = f1
+        second[x] = f2
+    
+    def _rotate(self, x: int) -> None:
+        """Rotate x above its parent."""
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if g >= 0:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child >= 0:
+            parent[child] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+    
+    def _splay(self, x: int) -> None:
+        """Make x the root of its splay tree."""
+        path = [x]
+        while not self._is_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+    
+    def _access(self, x: int) -> None:
+        """Make the root-to-x path preferred, with x at the root of its splay tree."""
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+    
+    def _make_root(self, x: int) -> None:
+        """Reroot x's tree at x."""
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+    
+    def find_root(self, x: int) -> int:
+        """Root of the tree containing x."""
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] < 0:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+    
+    def connected(self, x: int, y: int) -> bool:
+        """Whether x and y are in the same tree."""
+        return x == y or self.find_root(x) == self.find_root(y)
+    
+    def link(self, x: int, y: int) -> None:
+        """Add an edge between x and y, which must be in different trees."""
+        self._make_root(x)
+        self.parent[x] = y
+    
+    def cut(self, x: int, y: int) -> None:
+        """Remove the edge between adjacent nodes x and y."""
+        self._make_root(x)
+        self._access(y)
+        # The path is exactly x, y: x is y's left child
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+    
+    def path(self, x: int, y: int) -> Tuple[int, float, float]:
+        """
+        Aggregate over the path between x and y (same tree).
+        
+        Returns:
+            Tuple (top, first, second): the node with the largest (weight,
+            key) and the two largest distinct weights on the path
+        """
+        self._make_root(x)
+        self._access(y)
+        return self.top[y], self.first[y], self.second[y]
+    
+    def set_weight(self, x: int, weight: float) -> None:
+        """Change the weight of node x."""
+        self._access(x)
+        self.weight[x] = weight
+        self._pull(x)
+
+
+class DynamicMST:
+    """
+    A minimum spanning forest kept current under edge updates.
+    
+    Seeded with MST's Kruskal run, the forest lives in link-cut trees where
+    every tree edge is a node of its own, so path maxima are node maxima.
+    Edges are ordered by (weight, edge number), as in MST() and
+    MST_boruvka(), which keeps the forest unique:
+    
+    - A new edge, or a lighter non-tree edge, is checked against the
+      heaviest edge on the path between its endpoints and swapped in if
+      lighter: O(log V) amortized.
+    - A lighter tree edge or a heavier non-tree edge leaves the forest as
+      it is (only weights change).
+    - A heavier or removed tree edge is the fallback: the edge is cut and
+      the cheapest edge across the cut, found by one O(V + E) scan (no
+      sort), reconnects the two sides.
+    
+    The second_best_ST answer is cached. Updates that keep the forest's
+    edges and weights reprice only the changed non-tree edge with one
+    path query. Other updates drop the cache, and the next
+    second_best_ST() call rebuilds it with one O((V + E) log V) pass.
+    
+    The structure keeps its own copy of the edges; apply updates to the
+    original graph separately if it is still needed.
+    """
+    
+    def __init__(self, graph: Graph):
+        """
+        Build the structure from a graph's minimum spanning forest.
+        
+        Args:
+            graph: An undirected, weighted graph
+        
+        Raises:
+            ValueError: If graph is directed
+        """
+        if graph.directed:
+            raise ValueError("MST requires an undirected graph")
+        
+        self._forest = _LinkCutForest()
+        self._names: List[str] = graph.vertices()
+        self._ids: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        self._vertex_node = [self._forest.add_node() for _ in self._names]
+        self._tree_adjacency: List[Set[int]] = [set() for _ in self._names]
+        
+        src, dst, weights, tree = _kruskal(graph)
+        self._src: List[int] = src.tolist()
+        self._dst: List[int] = dst.tolist()
+        self._weight: List[float] = weights.tolist()
+        self._alive = [u != v for u, v in zip(self._src, self._dst)]
+        self._edge_node = [-1] * len(self._src)
+        self._index: Dict[Tuple[int, int], int] = {
+            (u, v): k for k, (u, v) in enumerate(zip(self._src, self._dst)) if u != v}
+        self._tree: Set[int] = set()
+        for k in tree:
+            self._link(k)
+        
+        # Cached (increase, edge, drop) of the best second-best swap
+        self._second: Optional[Tuple[float, int, float]] = None
+    
+    def _vertex(self, name: str) -> int:
+        """Id of a vertex, adding it if it is new."""
+        i = self._ids.get(name)
+        if i is None:
+            i = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._vertex_node.append(self._forest.add_node())
+            self._tree_adjacency.append(set())
+        return i
+    
+    def _link(self, k: int) -> None:
+        """Add edge k to the forest (its endpoints must be in different trees)."""
+        node = self._edge_node[k]
+        if node < 0:
+            node = self._edge_node[k] = self._forest.add_node(self._weight[k], k)
+        else:
+            self._forest.set_weight(node, self._weight[k])
+        u, v = self._src[k], self._dst[k]
+        self._forest.link(node, self._vertex_node[u])
+        self._forest.link(self._vertex_node[v], node)
+        self._tree_adjacency[u].add(k)
+        self._tree_adjacency[v].add(k)
+        self._tree.add(k)
+        self._second = None
+    
+    def _cut(self, k: int) -> None:
+        """Remove tree edge k from the forest."""
+        node = self._edge_node[k]
+        u, v = self._src[k], self._dst[k]
+        self._forest.cut(node, self._vertex_node[u])
+        self._forest.cut(node, self._vertex_node[v])
+        self._tree_adjacency[u].discard(k)
+        self._tree_adjacency[v].discard(k)
+        self._tree.discard(k)
+        self._second = None
+    
+    def _offer(self, k: int) -> bool:
+        """Swap non-tree edge k into the forest if that makes it lighter."""
+        forest = self._forest
+        a = self._vertex_node[self._src[k]]
+        b = self._vertex_node[self._dst[k]]
+        if not forest.connected(a, b):
+            self._link(k)
+            return True
+        top, first, second = forest.path(a, b)
+        t = forest.key[top]
+        w = self._weight[k]
+        if (self._weight[t], t) > (w, k):
+            self._cut(t)
+            self._link(k)
+            return True
+        self._reprice(k, first, second)
+        return False
+    
+    def _reprice(self, k: int, first: float, second: float) -> None:
+        """Update the cached second-best swap after non-tree edge k changed."""
+        if self._second is None:
+            return
+        w = self._weight[k]
+        drop = first if w > first else second
+        increase = w - drop if drop != -math.inf else math.inf
+        best_increase, best_edge, _ = self._second
+        if increase < best_increase or (k == best_edge and increase == best_increase):
+            self._second = (increase, k, drop)
+        elif k == best_edge:
+            # The best swap got worse; another edge may now be best
+            self._second = None
+    
+    def _reconnect(self, u: int) -> int:
+        """
+        After a cut, join u's side to the rest with the cheapest crossing edge.
+        
+        Returns:
+            The edge added, or -1 if no edge crosses the cut
+        """
+        side = bytearray(len(self._names))
+        side[u] = 1
+        stack = [u]
+        src, dst = self._src, self._dst
+        while stack:
+            x = stack.pop()
+            for k in self._tree_adjacency[x]:
+                y = src[k] if dst[k] == x else dst[k]
+                if not side[y]:
+                    side[y] = 1
+                    stack.append(y)
+        
+        weight, alive, tree = self._weight, self._alive, self._tree
+        best = -1
+        for k in range(len(src)):
+            if side[src[k]] != side[dst[k]] and alive[k] and k not in tree:
+                if best < 0 or (weight[k], k) < (weight[best], best):
+                    best = k
+        if best >= 0:
+            self._link(best)
+        return best
+    
+    def update_edge(self, u: str, v: str, weight: float) -> bool:
+        """
+        Add edge (u, v) or change its weight.
+        
+        New vertices are added as needed. Self-loops are ignored (they never
+        belong to a spanning tree).
+        
+        Args:
+            u: One endpoint
+            v: The other endpoint
+            weight: The new edge weight
+        
+        Returns:
+            True if the set of forest edges changed
+        """
+        i = self._vertex(u)
+        j = self._vertex(v)
+        if i == j:
+            return False
+        pair = (i, j) if i < j else (j, i)
+        k = self._index.get(pair)
+        if k is None:
+            k = self._index[pair] = len(self._src)
+            self._src.append(pair[0])
+            self._dst.append(pair[1])
+            self._weight.append(weight)
+            self._alive.append(True)
+            self._edge_node.append(-1)
+            return self._offer(k)
+        
+        old = self._weight[k]
+        self._weight[k] = weight
+        if not self._alive[k]:
+            self._alive[k] = True
+            return self._offer(k)
+        if k in self._tree:
+            if weight <= old:
+                self._forest.set_weight(self._edge_node[k], weight)
+                self._second = None
+                return False
+            # Heavier tree edge: it stays only if nothing cheaper crosses its cut
+            self._cut(k)
+            return self._reconnect(pair[0]) != k
+        if weight < old:
+            return self._offer(k)
+        if self._second is not None:
+            _, first, second = self._forest.path(self._vertex_node[pair[0]], self._vertex_node[pair[1]])
+            self._reprice(k, first, second)
+        return False
+    
+    def remove_edge(self, u: str, v: str) -> bool:
+        """
+        Remove edge (u, v).
+        
+        Args:
+            u: One endpoint
+            v: The other endpoint
+        
+        Returns:
+            True if the set of forest edges changed (always, for a tree edge)
+        
+        Raises:
+            KeyError: If the edge does not exist
+        """
+        i, j = self._ids.get(u), self._ids.get(v)
+        k = None
+        if i is not None and j is not None:
+            k = self._index.get((i, j) if i < j else (j, i))
+        if k is None or not self._alive[k]:
+            raise KeyError(f"Edge ({u}, {v}) not found")
+        self._alive[k] = False
+        if k in self._tree:
+            self._cut(k)
+            self._reconnect(self._src[k])
+            return True
+        if self._second is not None and self._second[1] == k:
+            self._second = None
+        return False
+    
+    def MST(self) -> List[Tuple[str, str, float]]:
+        """
+        The current minimum spanning forest.
+        
+        Returns:
+            A list of edges (u, v, weight) by increasing weight, as MST()
+        """
+        names, src, dst, weight = self._names, self._src, self._dst, self._weight
+        return [(names[src[k]], names[dst[k]], weight[k])
+                for k in sorted(self._tree, key=lambda k: (weight[k], k))]
+    
+    def total_weight(self) -> float:
+        """Total weight of the current minimum spanning forest."""
+        return math.fsum(self._weight[k] for k in self._tree)
+    
+    def second_best_ST(self) -> Optional[List[Tuple[str, str, float]]]:
+        """
+        The current second-best spanning tree (or forest).
+        
+        Returns:
+            A list of edges as second_best_ST() returns for the current
+            edges, or None if no strictly heavier spanning tree exists
+        """
+        src, dst, weight, tree = self._src, self._dst, self._weight, self._tree
+        if self._second is None:
+            paths = _PathMaxima(len(self._names), src, dst, weight, list(tree))
+            candidates = (k for k in range(len(src)) if self._alive[k] and k not in tree)
+            self._second = _best_swap(paths, src, dst, weight, candidates)
+        _, added, drop = self._second
+        if added < 0:
+            return None
+        
+        # Walk the tree path between the added edge's endpoints to the edge to drop
+        start, goal = src[added], dst[added]
+        via = {start: -1}
+        stack = [start]
+        while goal not in via:
+            x = stack.pop()
+            for k in self._tree_adjacency[x]:
+                y = src[k] if dst[k] == x else dst[k]
+                if y not in via:
+                    via[y] = k
+                    stack.append(y)
+        x = goal
+        while weight[via[x]] != drop:
+            k = via[x]
+            x = src[k] if dst[k] == x else dst[k]
+        removed = via[x]
+        
+        names = self._names
+        return [(names[src[k]], names[dst[k]], weight[k])
+                for k in sorted(tree, key=lambda k: (weight[k], k)) if k != removed] + \
+            [(names[src[added]], names[dst[added]], weight[added])]
 
 
 # ============================================
@@ -79,18 +907,24 @@ class UnionFind:
     Union-Find (Disjoint Set Union) data structure.
     
     Optional helper for Kruskal's algorithm.
-    You may implement this or use the example from examples/union_find_example.py
+    Vertex names are mapped to ids once; the sets themselves are kept in an
+    ArrayUnionFind (iterative find, union by size). MST() uses
+    ArrayUnionFind on vertex ids directly.
     """
     
     def __init__(self, vertices: List[str]):
         """Initialize Union-Find structure with given vertices."""
-        # TODO: Implement initialization
-        pass
+        self._ids = {}
+        self._names: List[str] = []
+        for v in vertices:
+            if v not in self._ids:
+                self._ids[v] = len(self._names)
+                self._names.append(v)
+        self._sets = ArrayUnionFind(len(self._names))
     
     def find(self, x: str) -> str:
         """Find the root/representative of the set containing x."""
-        # TODO: Implement find with path compression
-        pass
+        return self._names[self._sets.find(self._ids[x])]
     
     def union(self, x: str, y: str) -> bool:
         """
@@ -100,5 +934,4 @@ class UnionFind:
             True if x and y were in different sets (union performed)
             False if x and y were already in the same set
         """
-        # TODO: Implement union with rank
-        pass
+        return self._sets.union(self._ids[x], self._ids[y])
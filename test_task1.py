@@ -5,7 +5,9 @@ Test script for Task 1: Shortest Paths with Maximal Blue Nodes
 DO NOT MODIFY THIS FILE
 
 Usage: python test_task1.py [-R] <graph_file> <source> <target>
+       python test_task1.py [-R] -Q <graph_file> <queries_file>
   -R: Run reference implementation and compare results
+  -Q: Answer every "source target" line of queries_file in one batch
 
 Example: python test_task1.py data/small_graph.json A E
          python test_task1.py -R data/small_graph.json A E
@@ -13,6 +15,7 @@ Example: python test_task1.py data/small_graph.json A E
 
 import sys
 import os
+import time
 from graph import load_graph
 from tasks.task1_bfs import max_blue_path
 
@@ -48,11 +51,11 @@ def test_max_blue_path(graph_file, source, target, run_reference=False):
         print()
         
         # Verify source and target exist
-        if source not in graph.vertices():
+        if source not in graph:
             print(f"ERROR: Source vertex '{source}' not found in graph")
             return False
         
-        if target not in graph.vertices():
+        if target not in graph:
             print(f"ERROR: Target vertex '{target}' not found in graph")
             return False
         
@@ -132,6 +135,108 @@ def test_max_blue_path(graph_file, source, target, run_reference=False):
         return False
 
 
+def test_batch_queries(graph_file, queries_file, run_reference=False):
+    """
+    Test max_blue_paths on many (source, target) queries against one graph.
+    
+    Args:
+        graph_file: Path to the graph file to test
+        queries_file: Text file with one "source target" pair per line
+        run_reference: If True, also run reference implementation and compare
+    """
+    print(f"Testing Task 1: Batched Shortest Paths with Maximal Blue Nodes")
+    print(f"Graph file: {graph_file}")
+    print(f"Queries file: {queries_file}")
+    print("-" * 60)
+    
+    # Optional entry point, imported only for -Q
+    try:
+        from tasks.task1_bfs import max_blue_paths
+    except ImportError:
+        print("ERROR: -Q needs max_blue_paths(graph, queries) in tasks/task1_bfs.py")
+        return False
+    
+    try:
+        graph = load_graph(graph_file)
+        print(f"Loaded graph: {graph}")
+        
+        with open(queries_file) as f:
+            queries = [tuple(line.split()) for line in f if line.strip() and not line.startswith('#')]
+        
+        for i, query in enumerate(queries, 1):
+            if len(query) != 2:
+                print(f"ERROR: Query line {i} must contain exactly two vertices: {' '.join(query)}")
+                return False
+            for vertex in query:
+                if vertex not in graph:
+                    print(f"ERROR: Vertex '{vertex}' (query {i}) not found in graph")
+                    return False
+        
+        sources = len(set(s for s, _ in queries))
+        print(f"Queries: {len(queries)} ({sources} distinct sources)")
+        print()
+        
+        start = time.perf_counter()
+        results = max_blue_paths(graph, queries)
+        elapsed = time.perf_counter() - start
+        
+        if not isinstance(results, list) or len(results) != len(queries):
+            print(f"ERROR: Expected a list of {len(queries)} results, got {type(results)}")
+            return False
+        
+        for (source, target), result in zip(queries, results):
+            if not isinstance(result, int) or result < 0:
+                print(f"ERROR: Invalid result for ({source}, {target}): {result}")
+                return False
+            print(f"  {source} -> {target}: {result}")
+        
+        print()
+        rate = len(queries) / elapsed if elapsed > 0 else float('inf')
+        print(f"Answered {len(queries)} queries in {elapsed:.4f} s ({rate:.0f} queries/s)")
+        
+        if run_reference:
+            print()
+            print("=" * 60)
+            print("Running Reference Implementation")
+            print("=" * 60)
+            
+            try:
+                sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'Reference implementations'))
+                from task1_reference import max_blue_path as ref_max_blue_path
+                
+                mismatches = 0
+                for (source, target), result in zip(queries, results):
+                    ref_result = ref_max_blue_path(graph, source, target)
+                    if result != ref_result:
+                        print(f"✗ MISMATCH for ({source}, {target}): yours={result}, reference={ref_result}")
+                        mismatches += 1
+                
+                if mismatches:
+                    return False
+                print("✓ MATCH: All results match the reference implementation")
+                
+            except ImportError as e:
+                print(f"WARNING: Could not load reference implementation: {e}")
+                print("Make sure 'Reference implementations/task1_reference.py' exists")
+            except Exception as e:
+                print(f"ERROR in reference implementation: {type(e).__name__}: {e}")
+                import traceback
+                traceback.print_exc()
+        
+        print()
+        print("✓ Test PASSED")
+        return True
+        
+    except FileNotFoundError as e:
+        print(f"ERROR: File not found: {e.filename}")
+        return False
+    except Exception as e:
+        print(f"ERROR: {type(e).__name__}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Main entry point."""
     args = sys.argv[1:]
@@ -142,9 +247,19 @@ def main():
         run_reference = True
         args = args[1:]
     
+    # Check for -Q flag (batched queries)
+    if args and args[0] == "-Q":
+        if len(args) != 3:
+            print("Usage: python test_task1.py [-R] -Q <graph_file> <queries_file>")
+            sys.exit(1)
+        success = test_batch_queries(args[1], args[2], run_reference)
+        sys.exit(0 if success else 1)
+    
     if len(args) != 3:
         print("Usage: python test_task1.py [-R] <graph_file> <source> <target>")
+        print("       python test_task1.py [-R] -Q <graph_file> <queries_file>")
         print("  -R: Run reference implementation and compare results")
+        print("  -Q: Answer every \"source target\" line of queries_file in one batch")
         print()
         print("Example: python test_task1.py data/small_graph.json A E")
         print("         python test_task1.py -R data/small_graph.json A E")
@@ -43,11 +43,10 @@ def test_mst_algorithms(graph_file, run_reference=False):
         if not graph.weighted:
             print("WARNING: Graph is not weighted, all edges will have weight 1.0")
         
-        vertices = graph.vertices()
-        edges = graph.edges()
+        vertex_count = len(graph)
         
-        print(f"Vertices: {len(vertices)}")
-        print(f"Edges: {len(edges)}")
+        print(f"Vertices: {vertex_count}")
+        print(f"Edges: {graph.edge_count()}")
         print()
         
         # Test MST
@@ -64,7 +63,7 @@ def test_mst_algorithms(graph_file, run_reference=False):
                 return False
             
             # Check number of edges
-            expected_edges = len(vertices) - 1 if len(vertices) > 0 else 0
+            expected_edges = vertex_count - 1 if vertex_count > 0 else 0
             if len(mst) > expected_edges:
                 print(f"ERROR: MST has too many edges: {len(mst)} (expected ≤ {expected_edges})")
                 return False